@@ -0,0 +1,140 @@
+"""
+Numerical equivalence of the NumPy Leisen-Reimer tree with QuantLib's BinomialVanillaEngine.
+"""
+import unittest
+import numpy as np
+import QuantLib as ql
+from tsfin.stochasticprocess.equityprocess import BlackScholesMerton
+from tsfin.instruments.equities._binomial import leisen_reimer
+from tsfin.instruments.equities.equityoption import EquityOption
+
+STEPS = 801
+SPOT_PRICE = 100.0
+STRIKE = 100.0
+RISK_FREE_RATE = 0.05
+DIVIDEND_YIELD = 0.02
+VOLATILITY = 0.25
+REFERENCE_DATE = ql.Date(2, 1, 2020)
+DAY_COUNTER = ql.Actual365Fixed()
+# One year to maturity, where the tree time grid ends exactly at the maturity.
+MATURITY_DATE = ql.Date(1, 1, 2021)
+# 73 days to maturity, where (time / steps) * steps rounds below the time to maturity.
+ROUNDED_MATURITY_DATE = REFERENCE_DATE + 73
+
+
+def flat_curve(rate):
+    return ql.FlatForward(REFERENCE_DATE, rate, DAY_COUNTER)
+
+
+def quantlib_values(maturity_date, is_call, is_american):
+    """ Price, delta and gamma from QuantLib's BinomialVanillaEngine. """
+    ql.Settings.instance().evaluationDate = REFERENCE_DATE
+    process = ql.BlackScholesMertonProcess(ql.QuoteHandle(ql.SimpleQuote(SPOT_PRICE)),
+                                           ql.YieldTermStructureHandle(flat_curve(DIVIDEND_YIELD)),
+                                           ql.YieldTermStructureHandle(flat_curve(RISK_FREE_RATE)),
+                                           ql.BlackVolTermStructureHandle(
+                                               ql.BlackConstantVol(REFERENCE_DATE, ql.NullCalendar(), VOLATILITY,
+                                                                   DAY_COUNTER)))
+    if is_american:
+        exercise = ql.AmericanExercise(REFERENCE_DATE, maturity_date)
+    else:
+        exercise = ql.EuropeanExercise(maturity_date)
+    option_type = ql.Option.Call if is_call else ql.Option.Put
+    option = ql.VanillaOption(ql.PlainVanillaPayoff(option_type, STRIKE), exercise)
+    option.setPricingEngine(ql.BinomialVanillaEngine(process, 'LR', STEPS))
+    return option.NPV(), option.delta(), option.gamma()
+
+
+def kernel_values(maturity_date, is_call, is_american):
+    """ Price, delta and gamma from the NumPy Leisen-Reimer tree. """
+    time = DAY_COUNTER.yearFraction(REFERENCE_DATE, maturity_date)
+    return leisen_reimer(spot_price=SPOT_PRICE, strike=STRIKE, risk_free_rate=RISK_FREE_RATE,
+                         dividend_yield=DIVIDEND_YIELD, volatility=VOLATILITY, time=time, steps=STEPS,
+                         is_call=is_call, is_american=is_american)
+
+
+class ConstantComponent:
+    """ A timeseries component with the same value on every date. """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, index, last_available=True):
+        return self.value
+
+    def get_values(self, index, last_available=True, fill_value=np.nan):
+        return np.full(len(index), self.value)
+
+
+class TimeSeriesStub:
+    """ The attributes and components of an option or underlying timeseries. """
+
+    def __init__(self, ts_name, ts_attributes, **components):
+        self.ts_name = ts_name
+        self.ts_attributes = ts_attributes
+        for name, component in components.items():
+            setattr(self, name, component)
+
+
+class FlatYieldCurve:
+    """ A risk free yield curve timeseries with the same flat curve on every date. """
+
+    def yield_curve(self, date):
+        return flat_curve(RISK_FREE_RATE)
+
+
+def equity_option(option_type, binomial_tree_kernel):
+    """ An American option at the money, priced with the 'BINOMIAL_VANILLA' engine. """
+    timeseries = TimeSeriesStub('OPTION', {'OPTION_TYPE': option_type, 'STRIKE_PRICE': str(STRIKE),
+                                           'CONTRACT_SIZE': '100', 'MATURITY': '2021-01-01', 'CALENDAR': 'US',
+                                           'DAY_COUNT': 'ACTUAL365', 'EXERCISE_TYPE': 'AMERICAN',
+                                           'UNDERLYING_INSTRUMENT': 'UNDERLYING', 'PAYOFF_TYPE': 'PLAIN_VANILLA'},
+                                PX_MID=ConstantComponent(10.0))
+    option = EquityOption(timeseries)
+    option.underlying_instrument = TimeSeriesStub('UNDERLYING', dict(),
+                                                  UNADJUSTED_PRICE=ConstantComponent(SPOT_PRICE),
+                                                  EQY_DVD_YLD_12M=ConstantComponent(0.0))
+    option.set_yield_curve(FlatYieldCurve())
+    option.set_ql_process(BlackScholesMerton)
+    option.engine_name = 'BINOMIAL_VANILLA'
+    option.binomial_tree_kernel = binomial_tree_kernel
+    return option
+
+
+class TestLeisenReimer(unittest.TestCase):
+
+    def test_at_the_money(self):
+        for is_american in (True, False):
+            for is_call in (True, False):
+                with self.subTest(is_american=is_american, is_call=is_call):
+                    np.testing.assert_allclose(kernel_values(MATURITY_DATE, is_call, is_american),
+                                               quantlib_values(MATURITY_DATE, is_call, is_american), atol=1e-8)
+
+    def test_equity_option_kernel(self):
+        for option_type in ('CALL', 'PUT'):
+            with self.subTest(option_type=option_type):
+                values = [equity_option(option_type, binomial_tree_kernel).greeks(
+                    date=REFERENCE_DATE, greeks=('price', 'delta', 'gamma'), volatility=VOLATILITY,
+                    dividend_yield=DIVIDEND_YIELD) for binomial_tree_kernel in (True, False)]
+                for greek in ('price', 'delta', 'gamma'):
+                    self.assertAlmostEqual(values[0][greek], values[1][greek], delta=1e-8)
+
+    def test_rounded_maturity(self):
+        """ Where the time grid of QuantLib's tree ends just before the maturity, QuantLib doesn't apply the payoff
+        of American options at maturity, so it prices them below the tree with the payoff by about the value of the
+        last step. European options are unaffected. """
+        time = DAY_COUNTER.yearFraction(REFERENCE_DATE, ROUNDED_MATURITY_DATE)
+        self.assertLess(time / STEPS * STEPS, time)
+        for is_call in (True, False):
+            with self.subTest(is_call=is_call):
+                price = kernel_values(ROUNDED_MATURITY_DATE, is_call, is_american=True)[0]
+                quantlib_price = quantlib_values(ROUNDED_MATURITY_DATE, is_call, is_american=True)[0]
+                self.assertGreater(price - quantlib_price, 1e-3)
+                self.assertLess(price - quantlib_price, 1e-2)
+                np.testing.assert_allclose(kernel_values(ROUNDED_MATURITY_DATE, is_call, is_american=False),
+                                           quantlib_values(ROUNDED_MATURITY_DATE, is_call, is_american=False),
+                                           atol=1e-8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+Numerical equivalence of the NumPy Black Scholes formulas with QuantLib's AnalyticEuropeanEngine.
+"""
+import unittest
+import numpy as np
+import QuantLib as ql
+from tsfin.stochasticprocess.equityprocess import BlackScholesMerton
+from tsfin.instruments.equities._black import black_implied_volatility, black_price, black_scholes_greeks
+from tsfin.instruments.equities.equityoption import EquityOption
+
+SPOT_PRICE = 100.0
+STRIKE = 100.0
+RISK_FREE_RATE = 0.05
+DIVIDEND_YIELD = 0.02
+VOLATILITY = 0.25
+REFERENCE_DATE = ql.Date(2, 1, 2020)
+DAY_COUNTER = ql.Actual365Fixed()
+MATURITY_DATE = ql.Date(1, 1, 2021)
+
+
+def flat_curve(rate):
+    return ql.FlatForward(REFERENCE_DATE, rate, DAY_COUNTER)
+
+
+def quantlib_option(strike, is_call):
+    """ A European option priced by QuantLib's AnalyticEuropeanEngine, and its Black Scholes Merton process. """
+    ql.Settings.instance().evaluationDate = REFERENCE_DATE
+    process = ql.BlackScholesMertonProcess(ql.QuoteHandle(ql.SimpleQuote(SPOT_PRICE)),
+                                           ql.YieldTermStructureHandle(flat_curve(DIVIDEND_YIELD)),
+                                           ql.YieldTermStructureHandle(flat_curve(RISK_FREE_RATE)),
+                                           ql.BlackVolTermStructureHandle(
+                                               ql.BlackConstantVol(REFERENCE_DATE, ql.NullCalendar(), VOLATILITY,
+                                                                   DAY_COUNTER)))
+    option_type = ql.Option.Call if is_call else ql.Option.Put
+    option = ql.VanillaOption(ql.PlainVanillaPayoff(option_type, strike), ql.EuropeanExercise(MATURITY_DATE))
+    option.setPricingEngine(ql.AnalyticEuropeanEngine(process))
+    return option, process
+
+
+def kernel_inputs(strike, is_call):
+    """ The arguments of black_scholes_greeks for the options of quantlib_option. """
+    time = DAY_COUNTER.yearFraction(REFERENCE_DATE, MATURITY_DATE)
+    return dict(spot_price=SPOT_PRICE, strike=strike, discount=flat_curve(RISK_FREE_RATE).discount(MATURITY_DATE),
+                dividend_discount=flat_curve(DIVIDEND_YIELD).discount(MATURITY_DATE), volatility=VOLATILITY,
+                volatility_time=time, rate_time=time, is_call=is_call)
+
+
+def forward_inputs(strike, is_call):
+    """ The forward, discount and time of black_price and black_implied_volatility for the options of
+    quantlib_option. """
+    inputs = kernel_inputs(strike, is_call)
+    return dict(forward=SPOT_PRICE * inputs['dividend_discount'] / inputs['discount'], strike=strike,
+                discount=inputs['discount'], time=inputs['volatility_time'], is_call=is_call)
+
+
+class ConstantComponent:
+    """ A timeseries component with the same value on every date. """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, index, last_available=True):
+        return self.value
+
+    def get_values(self, index, last_available=True, fill_value=np.nan):
+        return np.full(len(index), self.value)
+
+
+class TimeSeriesStub:
+    """ The attributes and components of an option or underlying timeseries. """
+
+    def __init__(self, ts_name, ts_attributes, **components):
+        self.ts_name = ts_name
+        self.ts_attributes = ts_attributes
+        for name, component in components.items():
+            setattr(self, name, component)
+
+
+class FlatYieldCurve:
+    """ A risk free yield curve timeseries with the same flat curve on every date. """
+
+    def yield_curve(self, date):
+        return ql.FlatForward(date, RISK_FREE_RATE, DAY_COUNTER)
+
+
+def equity_option(option_type, option_price):
+    """ A European option at the money, with the same mid price on every date. """
+    timeseries = TimeSeriesStub('OPTION', {'OPTION_TYPE': option_type, 'STRIKE_PRICE': str(STRIKE),
+                                           'CONTRACT_SIZE': '100', 'MATURITY': '2021-01-01', 'CALENDAR': 'US',
+                                           'DAY_COUNT': 'ACTUAL365', 'EXERCISE_TYPE': 'EUROPEAN',
+                                           'UNDERLYING_INSTRUMENT': 'UNDERLYING', 'PAYOFF_TYPE': 'PLAIN_VANILLA'},
+                                PX_MID=ConstantComponent(option_price))
+    option = EquityOption(timeseries)
+    option.underlying_instrument = TimeSeriesStub('UNDERLYING', dict(),
+                                                  UNADJUSTED_PRICE=ConstantComponent(SPOT_PRICE),
+                                                  EQY_DVD_YLD_12M=ConstantComponent(DIVIDEND_YIELD))
+    option.set_yield_curve(FlatYieldCurve())
+    option.set_ql_process(BlackScholesMerton)
+    return option
+
+
+class TestBlackScholes(unittest.TestCase):
+
+    def test_greeks(self):
+        for strike in (80.0, STRIKE, 120.0):
+            for is_call in (True, False):
+                with self.subTest(strike=strike, is_call=is_call):
+                    option, _ = quantlib_option(strike, is_call)
+                    expected = (option.NPV(), option.delta(), option.gamma(), option.theta(), option.vega(),
+                                option.rho())
+                    np.testing.assert_allclose(black_scholes_greeks(**kernel_inputs(strike, is_call)), expected,
+                                               rtol=1e-10, atol=1e-10)
+
+    def test_arrays(self):
+        strikes = np.array([80.0, STRIKE, 120.0])
+        is_call = np.array([True, False, True])
+        greeks = black_scholes_greeks(**kernel_inputs(strikes, is_call))
+        for i in range(len(strikes)):
+            np.testing.assert_allclose([greek[i] for greek in greeks],
+                                       black_scholes_greeks(**kernel_inputs(strikes[i], is_call[i])), rtol=1e-14)
+
+    def test_price(self):
+        std_dev = VOLATILITY * np.sqrt(DAY_COUNTER.yearFraction(REFERENCE_DATE, MATURITY_DATE))
+        for strike in (80.0, STRIKE, 120.0):
+            for is_call in (True, False):
+                with self.subTest(strike=strike, is_call=is_call):
+                    inputs = forward_inputs(strike, is_call)
+                    del inputs['time']
+                    self.assertAlmostEqual(black_price(std_dev=std_dev, **inputs),
+                                           quantlib_option(strike, is_call)[0].NPV(), delta=1e-10)
+
+    def test_implied_volatility(self):
+        for strike in (80.0, STRIKE, 120.0):
+            for is_call in (True, False):
+                with self.subTest(strike=strike, is_call=is_call):
+                    option, process = quantlib_option(strike, is_call)
+                    price = option.NPV() * 1.1
+                    expected = option.impliedVolatility(price, process, 1e-12, 100)
+                    self.assertAlmostEqual(black_implied_volatility(price=price, **forward_inputs(strike, is_call)),
+                                           expected, delta=1e-10)
+
+    def test_implied_volatility_below_intrinsic(self):
+        inputs = forward_inputs(80.0, True)
+        intrinsic = inputs['discount'] * (inputs['forward'] - inputs['strike'])
+        self.assertTrue(np.isnan(black_implied_volatility(price=intrinsic - 0.5, **inputs)))
+
+
+class TestEquityOptionImpliedVolatility(unittest.TestCase):
+
+    def test_scalar_and_batched(self):
+        dates = [REFERENCE_DATE + days for days in range(0, 70, 7)]
+        for option_type in ('CALL', 'PUT'):
+            with self.subTest(option_type=option_type):
+                batched = equity_option(option_type, 8.0).implied_volatility(date=dates)
+                option = equity_option(option_type, 8.0)
+                scalar = [option.implied_volatility(date=date) for date in dates]
+                np.testing.assert_allclose(batched, scalar, rtol=0, atol=1e-10)
+
+    def test_below_intrinsic(self):
+        """ Prices below the intrinsic value of the forward are replaced by that intrinsic value plus 0.01. """
+        batched = equity_option('CALL', 1.0).implied_volatility(date=[REFERENCE_DATE])
+        option = equity_option('CALL', 1.0)
+        scalar = option.implied_volatility(date=REFERENCE_DATE)
+        # QuantLib's solution on the curves of the option process.
+        base_equity_process = option.base_equity_process
+        process = ql.BlackScholesMertonProcess(ql.QuoteHandle(ql.SimpleQuote(SPOT_PRICE)),
+                                               base_equity_process.dividend_handle,
+                                               base_equity_process.risk_free_handle,
+                                               ql.BlackVolTermStructureHandle(
+                                                   ql.BlackConstantVol(REFERENCE_DATE, ql.NullCalendar(), VOLATILITY,
+                                                                       DAY_COUNTER)))
+        forward = SPOT_PRICE * base_equity_process.dividend_handle.discount(MATURITY_DATE) \
+            / base_equity_process.risk_free_handle.discount(MATURITY_DATE)
+        european_option, _ = quantlib_option(STRIKE, True)
+        expected = european_option.impliedVolatility(forward - STRIKE + 0.01, process, 1e-12, 100)
+        np.testing.assert_allclose(batched, [expected], rtol=0, atol=1e-10)
+        self.assertAlmostEqual(scalar, expected, delta=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
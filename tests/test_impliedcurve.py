@@ -0,0 +1,67 @@
+"""
+Forward rates of the implied yield curves against QuantLib's ImpliedTermStructure.
+"""
+import unittest
+import numpy as np
+import QuantLib as ql
+from tsfin.curves.impliedcurve import ImpliedYieldCurveTimeSeries
+
+BASE_DATE = ql.Date(2, 1, 2020)
+DATE = BASE_DATE + ql.Period(6, ql.Months)
+DAY_COUNTER = ql.Actual365Fixed()
+CALENDAR = ql.TARGET()
+
+
+class ZeroCurveTimeSeries:
+    """ A yield curve timeseries with the same upward sloping zero curve on every date. """
+
+    day_counter = DAY_COUNTER
+    calendar = CALENDAR
+
+    def __init__(self):
+        dates = [BASE_DATE + ql.Period(i, ql.Months) for i in range(0, 121, 6)]
+        rates = [0.02 + 0.001 * i for i in range(len(dates))]
+        self.curve = ql.ZeroCurve(dates, rates, DAY_COUNTER, CALENDAR)
+        self.curve.enableExtrapolation()
+
+    def yield_curve_handle(self, date):
+        return ql.YieldTermStructureHandle(self.curve)
+
+
+def quantlib_forward_rate(curve_time_series, date, to_date1, to_date2):
+    implied_curve = ql.ImpliedTermStructure(curve_time_series.yield_curve_handle(BASE_DATE), date)
+    return implied_curve.forwardRate(to_date1, to_date2, DAY_COUNTER, ql.Continuous, ql.Annual).rate()
+
+
+class TestForwardRate(unittest.TestCase):
+
+    def setUp(self):
+        ql.Settings.instance().evaluationDate = BASE_DATE
+        self.curve_time_series = ZeroCurveTimeSeries()
+        self.implied_curve = ImpliedYieldCurveTimeSeries(self.curve_time_series, BASE_DATE)
+
+    def test_forward_rate(self):
+        to_dates1 = [DATE + ql.Period(i, ql.Months) for i in range(0, 24, 3)]
+        to_dates2 = [to_date + ql.Period(1, ql.Years) for to_date in to_dates1]
+        expected = [quantlib_forward_rate(self.curve_time_series, DATE, to_date1, to_date2)
+                    for to_date1, to_date2 in zip(to_dates1, to_dates2)]
+        rates = self.implied_curve.forward_rate_date_to_date(DATE, to_dates1, to_dates2, ql.Continuous, ql.Annual)
+        np.testing.assert_allclose(rates, expected, atol=1e-12)
+        self.assertAlmostEqual(self.implied_curve.forward_rate_date_to_date(DATE, to_dates1[1], to_dates2[1],
+                                                                            ql.Continuous, ql.Annual),
+                               expected[1], delta=1e-12)
+
+    def test_forward_period_before_date(self):
+        to_date1 = DATE - ql.Period(1, ql.Months)
+        to_date2 = DATE + ql.Period(1, ql.Years)
+        with self.assertRaises(RuntimeError):
+            quantlib_forward_rate(self.curve_time_series, DATE, to_date1, to_date2)
+        with self.assertRaises(RuntimeError):
+            self.implied_curve.forward_rate_date_to_date(DATE, to_date1, to_date2, ql.Continuous, ql.Annual)
+        with self.assertRaises(RuntimeError):
+            self.implied_curve.forward_rate_date_to_date(DATE, [DATE, to_date1], to_date2, ql.Continuous,
+                                                         ql.Annual)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+OptionChain closed form prices and Greeks against the options priced one by one.
+"""
+import unittest
+import numpy as np
+import QuantLib as ql
+from tsfin.instruments.equities.equityoption import EquityOption
+from tsfin.instruments.equities.optionchain import OptionChain
+from tsfin.instruments.equities._black import black_scholes_greeks
+
+SPOT_PRICE = 100.0
+RISK_FREE_RATE = 0.05
+DIVIDEND_YIELD = 0.02
+VOLATILITY = 0.25
+REFERENCE_DATE = ql.Date(2, 1, 2020)
+DAY_COUNTER = ql.Actual365Fixed()
+
+
+class TimeSeriesStub:
+    """ The attributes of an option timeseries. """
+
+    def __init__(self, ts_name, ts_attributes):
+        self.ts_name = ts_name
+        self.ts_attributes = ts_attributes
+
+
+def equity_option(option_type, strike, exercise_type):
+    """ An option maturing on 2021-01-01. """
+    return EquityOption(TimeSeriesStub('{} {}'.format(option_type, strike),
+                                       {'OPTION_TYPE': option_type, 'STRIKE_PRICE': str(strike),
+                                        'CONTRACT_SIZE': '100', 'MATURITY': '2021-01-01', 'CALENDAR': 'US',
+                                        'DAY_COUNT': 'ACTUAL365', 'EXERCISE_TYPE': exercise_type,
+                                        'UNDERLYING_INSTRUMENT': 'UNDERLYING', 'PAYOFF_TYPE': 'PLAIN_VANILLA'}))
+
+
+def option_chain(exercise_type):
+    return OptionChain([equity_option(option_type, strike, exercise_type) for option_type in ('CALL', 'PUT')
+                        for strike in (90.0, 100.0, 110.0)])
+
+
+class TestOptionChain(unittest.TestCase):
+
+    def test_european_chain(self):
+        chain = option_chain('EUROPEAN')
+        values = chain.greeks_all(date=REFERENCE_DATE, spot_price=SPOT_PRICE, risk_free_rate=RISK_FREE_RATE,
+                                  dividend_yield=DIVIDEND_YIELD, volatility=VOLATILITY)
+        time = DAY_COUNTER.yearFraction(REFERENCE_DATE, ql.Date(1, 1, 2021))
+        expected = black_scholes_greeks(spot_price=SPOT_PRICE, strike=chain.strikes,
+                                        discount=np.exp(-RISK_FREE_RATE * time),
+                                        dividend_discount=np.exp(-DIVIDEND_YIELD * time), volatility=VOLATILITY,
+                                        volatility_time=time, rate_time=time, is_call=chain.is_call)
+        for greek, expected_values in zip(('price', 'delta', 'gamma', 'theta', 'vega', 'rho'), expected):
+            np.testing.assert_allclose(values[greek], expected_values, rtol=1e-14)
+
+    def test_american_chain(self):
+        chain = option_chain('AMERICAN')
+        for method in (chain.price_all, chain.greeks_all):
+            with self.subTest(method=method.__name__):
+                with self.assertRaises(ValueError):
+                    method(date=REFERENCE_DATE, spot_price=SPOT_PRICE, risk_free_rate=RISK_FREE_RATE,
+                           dividend_yield=DIVIDEND_YIELD, volatility=VOLATILITY)
+
+    def test_exercise_type_change(self):
+        chain = option_chain('EUROPEAN')
+        chain.options[0].change_exercise_type('AMERICAN')
+        with self.assertRaises(ValueError):
+            chain.price_all(date=REFERENCE_DATE, spot_price=SPOT_PRICE, risk_free_rate=RISK_FREE_RATE,
+                            dividend_yield=DIVIDEND_YIELD, volatility=VOLATILITY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -84,6 +84,8 @@ class Instrument:
     timeseries: :py:obj:`TimeSeries`
 
     """
+    # Subclasses without __slots__ keep a __dict__ for their own attributes.
+    __slots__ = ('timeseries',)
 
     def __init__(self, timeseries):
         self.timeseries = timeseries
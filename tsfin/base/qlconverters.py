@@ -17,8 +17,31 @@
 """
 Functions for converting strings to QuantLib objects. Used to map attributes stored in the database to objects.
 """
+import numpy as np
 import pandas as pd
 import QuantLib as ql
+from functools import lru_cache
+from tsfin.base.basetools import isvectorizable
+
+# QuantLib serial number of numpy.datetime64's epoch.
+EPOCH_SERIAL_NUMBER = ql.Date(1, 1, 1970).serialNumber()
+# Number of steps of the Leisen-Reimer tree used by the 'BINOMIAL_VANILLA' option engine.
+BINOMIAL_TIME_STEPS = 801
+# Maximum number of distinct option exercises kept by to_ql_option_exercise_type.
+EXERCISE_CACHE_SIZE = 8192
+# Maximum number of distinct option payoffs kept by to_ql_option_payoff.
+PAYOFF_CACHE_SIZE = 8192
+# Maximum number of date-like objects with a stored QuantLib serial number.
+DATE_CACHE_SIZE = 65536
+# Maximum number of calendar codes with a stored QuantLib calendar.
+CALENDAR_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _date_serial(arg, tzinfo):
+    # tzinfo is part of the key because timezone aware timestamps at the same instant compare equal.
+    arg = pd.to_datetime(arg)
+    return ql.Date(arg.day, arg.month, arg.year).serialNumber()
 
 
 def to_ql_date(arg):
@@ -30,11 +53,41 @@ def to_ql_date(arg):
     """
     if isinstance(arg, ql.Date):
         return arg
-    else:
+    try:
+        # Only the serial number is cached, a new QuantLib.Date is returned every time.
+        return ql.Date(_date_serial(arg, getattr(arg, 'tzinfo', None)))
+    except TypeError:
+        # Unhashable arguments are converted without the cache.
         arg = pd.to_datetime(arg)
         return ql.Date(arg.day, arg.month, arg.year)
 
 
+def to_ql_date_serials(arg):
+    """Converts a date-like or a list-like of date-likes to QuantLib serial numbers, without building a QuantLib.Date
+    for each element.
+
+    :param arg: date-like or list-like of date-like
+        The date(s) to be converted.
+    :return int or numpy.ndarray of int64
+        The serial number(s) of the corresponding QuantLib.Date(s).
+    """
+    if not isvectorizable(arg):
+        return to_ql_date(arg).serialNumber()
+    if isinstance(arg, np.ndarray) and np.issubdtype(arg.dtype, np.datetime64):
+        days = arg.astype('datetime64[D]')
+    else:
+        if not isinstance(arg, pd.DatetimeIndex):
+            arg = list(arg)
+            if any(isinstance(date, ql.Date) for date in arg):
+                return np.fromiter((to_ql_date(date).serialNumber() for date in arg), dtype=np.int64,
+                                   count=len(arg))
+            arg = pd.DatetimeIndex(pd.to_datetime(arg))
+        if arg.tz is not None:
+            arg = arg.tz_localize(None)
+        days = arg.values.astype('datetime64[D]')
+    return days.astype(np.int64) + EPOCH_SERIAL_NUMBER
+
+
 def to_ql_frequency(arg):
     """Converts string with a period representing a tenor to a QuantLib period.
 
@@ -97,8 +150,10 @@ def to_ql_weekday(arg):
         raise ValueError("Unable to convert {} to a QuantLib weekday".format(arg))
 
 
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
 def to_ql_calendar(arg):
-    """Converts string with a calendar name to a calendar instance of QuantLib.
+    """Converts string with a calendar name to a calendar instance of QuantLib. The calendar of each code is built once,
+    QuantLib calendars of the same market share their holidays anyway.
 
     :param arg: str
         The Calendar 2 letter code, exceptions being TARGET, NYSE and NULL
@@ -437,16 +492,27 @@ def to_ql_option_exercise_type(exercise_type, earliest_date, maturity):
     :param maturity: QuantLib.Date
         The maturity / exercise date
     :return: QuantLib.Exercise
+        Options with the same exercise type and dates share the same (immutable) exercise object.
     """
-    if exercise_type.upper() == 'AMERICAN':
-        return ql.AmericanExercise(earliest_date, maturity)
-    elif exercise_type.upper() == 'EUROPEAN':
-        return ql.EuropeanExercise(maturity)
+    exercise_type = exercise_type.upper()
+    if exercise_type == 'AMERICAN':
+        return _option_exercise(exercise_type, earliest_date.serialNumber(), maturity.serialNumber())
+    elif exercise_type == 'EUROPEAN':
+        return _option_exercise(exercise_type, None, maturity.serialNumber())
     else:
         raise ValueError('Exercise type not supported')
 
 
-def to_ql_option_engine(engine_name=None, process=None, model=None):
+@lru_cache(maxsize=EXERCISE_CACHE_SIZE)
+def _option_exercise(exercise_type, earliest_serial, maturity_serial):
+
+    if exercise_type == 'AMERICAN':
+        return ql.AmericanExercise(ql.Date(earliest_serial), ql.Date(maturity_serial))
+    return ql.EuropeanExercise(ql.Date(maturity_serial))
+
+
+def to_ql_option_engine(engine_name=None, process=None, model=None, exercise_type=None,
+                        time_steps=BINOMIAL_TIME_STEPS):
     """ Returns a QuantLib.PricingEngine for Options
 
     :param engine_name: str
@@ -454,10 +520,20 @@ def to_ql_option_engine(engine_name=None, process=None, model=None):
     :param process: QuantLib.StochasticProcess
         The QuantLib object with the option Stochastic Process.
     :param model: QuantLib.CalibratedModel
+    :param exercise_type: str, optional
+        The option exercise name. The 'BINOMIAL_VANILLA' and 'FINITE_DIFFERENCES' engines use the closed-form Black
+        Scholes formula for 'EUROPEAN' options, since the tree and the grid would only approximate it. Asking for
+        'FINITE_DIFFERENCES' therefore gives an AnalyticEuropeanEngine for 'EUROPEAN' options, whose prices and
+        Greeks differ from the FdBlackScholesVanillaEngine ones by the grid error, about 1e-2 in price and more for
+        far dates.
+    :param time_steps: int, optional
+        The number of steps of the 'BINOMIAL_VANILLA' tree.
     :return: QuantLib.PricingEngine
     """
     if engine_name.upper() == 'BINOMIAL_VANILLA':
-        return ql.BinomialVanillaEngine(process, 'LR', 801)
+        if str(exercise_type).upper() == 'EUROPEAN':
+            return ql.AnalyticEuropeanEngine(process)
+        return ql.BinomialVanillaEngine(process, 'LR', time_steps)
     elif engine_name.upper() == 'ANALYTIC_HESTON':
         if model is None:
             model = ql.HestonModel(process)
@@ -469,6 +545,8 @@ def to_ql_option_engine(engine_name=None, process=None, model=None):
     elif engine_name.upper() == 'ANALYTIC_EUROPEAN_DIVIDEND':
         return ql.AnalyticDividendEuropeanEngine(process)
     elif engine_name.upper() == "FINITE_DIFFERENCES":
+        if str(exercise_type).upper() == 'EUROPEAN':
+            return ql.AnalyticEuropeanEngine(process)
         return ql.FdBlackScholesVanillaEngine(process)
     elif engine_name.upper() == 'HESTON_FINITE_DIFFERENCES':
         if model is None:
@@ -531,8 +609,15 @@ def to_ql_option_payoff(payoff_type, ql_option_type, strike):
     :param strike: float
         The strike value
     :return: QuantLib.StrikedTypePayoff
+        Options with the same payoff type, option type and strike share the same (immutable) payoff object.
     """
-    if str(payoff_type).upper() == 'PLAIN_VANILLA':
+    return _option_payoff(str(payoff_type).upper(), ql_option_type, float(strike))
+
+
+@lru_cache(maxsize=PAYOFF_CACHE_SIZE)
+def _option_payoff(payoff_type, ql_option_type, strike):
+
+    if payoff_type == 'PLAIN_VANILLA':
         return ql.PlainVanillaPayoff(ql_option_type, strike)
 
 
@@ -18,17 +18,149 @@
 ImpliedYieldCurveTimeSeries, a class to handle a time series of implied yield curves.
 """
 
+from collections import OrderedDict
+import math
+import numpy as np
 import QuantLib as ql
-from tsfin.base import to_ql_date, conditional_vectorize
+from tsfin.base import to_ql_date, to_ql_date_serials, isvectorizable, ExtendedArray
+
+
+DISCOUNTS_INITIAL_SIZE = 365 * 10
+
+
+def _cache_store(cache, key, value, max_size):
+    """ Store `value` in an OrderedDict used as a LRU cache, dropping the least recently used entry if needed.
+    """
+    cache[key] = value
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+    return value
+
+
+def _continuous_rate(compound, time):
+    """ Continuously compounded rate of a (scalar) compound factor over `time` years.
+    """
+    return math.log(compound) / time
+
+
+def _implied_rates(compound, time, compounding, frequency):
+    """ Vectorized version of QuantLib.InterestRate.impliedRate.
+
+    Parameters
+    ----------
+    compound: numpy.ndarray
+        The compound factors.
+    time: numpy.ndarray
+        The year fractions of the compound factors.
+    compounding: QuantLib.Compounding
+        Compounding convention for the rates.
+    frequency: QuantLib.Frequency
+        Frequency convention for the rates.
+
+    Returns
+    -------
+    numpy.ndarray, None
+        The implied rates, or None if the compounding convention is not handled here.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if compounding == ql.Simple:
+            return (compound - 1) / time
+        if compounding == ql.Continuous:
+            return np.log(compound) / time
+        if frequency <= 0 or frequency == ql.OtherFrequency:
+            return None
+        compounded = (compound ** (1 / (frequency * time)) - 1) * frequency
+        if compounding == ql.Compounded:
+            return compounded
+        if compounding == ql.SimpleThenCompounded:
+            return np.where(time <= 1 / frequency, (compound - 1) / time, compounded)
+    return None
 
 
 class ImpliedYieldCurveTimeSeries:
 
-    def __init__(self, yield_curve_time_series, base_date):
+    def __init__(self, yield_curve_time_series, base_date, cache_size=4096):
+        """Time series of QuantLib ImpliedTermStructure objects, implied by the yield curve at `base_date`.
+
+        The QuantLib ImpliedTermStructure objects (and their handles) are 'lazy' created and stored, by date, in a
+        LRU cache holding at most `cache_size` entries. The discount factors of the yield curve at `base_date` are
+        also stored, in an array indexed by the number of days after `base_date`, as they are requested.
+
+        Parameters
+        ----------
+        yield_curve_time_series: :py:obj:`YieldCurveTimeSeries`
+            The yield curve time series used to build the implied curves.
+        base_date: QuantLib.Date
+            The date of the yield curve used to build the implied curves.
+        cache_size: int, optional
+            Maximum number of implied curves kept in memory. Defaults to 4096.
+        """
         self.yield_curve_time_series = yield_curve_time_series
         self.day_counter = self.yield_curve_time_series.day_counter
         self.calendar = self.yield_curve_time_series.calendar
         self.base_date = to_ql_date(base_date)
+        self.cache_size = cache_size
+        self._implied_curves = OrderedDict()
+        self._base_serial = self.base_date.serialNumber()
+        self._base_curve_handle = None
+        # NaN flags a discount factor that was not requested yet.
+        self._discounts = np.full(DISCOUNTS_INITIAL_SIZE, np.nan)
+        # Year fractions by day counter name and (start serial, end serial); they don't depend on the curve.
+        self._year_fraction_caches = dict()
+        # Scalar QuantLib calculations, broadcast over arrays of serial numbers when the vectorized kernels can't
+        # handle some of the elements.
+        self._zero_rate_ufunc = np.frompyfunc(self._zero_rate_from_serials, 6, 1)
+        self._forward_rate_ufunc = np.frompyfunc(self._forward_rate_from_serials, 7, 1)
+
+    def clear_cache(self):
+        """ Drop the stored implied curves and discount factors, e.g. after the yield curve at ``self.base_date`` is
+        rebuilt.
+        """
+        self._implied_curves.clear()
+        self._base_curve_handle = None
+        self._discounts = np.full(DISCOUNTS_INITIAL_SIZE, np.nan)
+
+    def _base_handle(self):
+        """ Handle for the yield curve at ``self.base_date``, created once and reused by every implied curve.
+        """
+        if self._base_curve_handle is None:
+            self._base_curve_handle = self.yield_curve_time_series.yield_curve_handle(self.base_date)
+        return self._base_curve_handle
+
+    def _discount(self, serial):
+        """ Discount factor of the yield curve at ``self.base_date``, to the date with serial number `serial`.
+
+        Parameters
+        ----------
+        serial: int
+            QuantLib serial number of the date.
+
+        Returns
+        -------
+        scalar
+            The (extrapolated, if needed) discount factor to the date.
+        """
+        offset = serial - self._base_serial
+        discounts = self._discounts
+        if 0 <= offset < len(discounts) and not np.isnan(discounts[offset]):
+            return discounts[offset]
+        # Like QuantLib.ImpliedTermStructure, always extrapolate the base yield curve.
+        discount = self._base_handle().discount(ql.Date(int(serial)), True)
+        if offset >= 0:
+            self._grow_discounts(offset)
+            self._discounts[offset] = discount
+        return discount
+
+    def _grow_discounts(self, offset):
+        """ Make room in the discount factors table for the date `offset` days after ``self.base_date``.
+        """
+        if offset >= len(self._discounts):
+            new_size = max(offset + 1, 2 * len(self._discounts))
+            self._discounts = np.concatenate((self._discounts, np.full(new_size - len(self._discounts), np.nan)))
+
+    def _max_serial(self):
+
+        return self._base_handle().maxDate().serialNumber()
 
     def yield_curve(self, date):
 
@@ -45,8 +177,7 @@ class ImpliedYieldCurveTimeSeries:
             The implied yield curve at `date`.
         """
 
-        date = to_ql_date(date)
-        return ql.ImpliedTermStructure(self.yield_curve_time_series.yield_curve_handle(self.base_date), date)
+        return self._implied_curve(date)[0]
 
     def yield_curve_handle(self, date):
         """ Handle for a yield curve at a given date.
@@ -61,9 +192,83 @@ class ImpliedYieldCurveTimeSeries:
         QuantLib.YieldTermStructureHandle
             A handle to the yield term structure object.
         """
-        return ql.YieldTermStructureHandle(self.yield_curve(date))
+        return self._implied_curve(date)[1]
+
+    def _implied_curve(self, date):
+        """ The implied yield curve at `date` and its handle, sharing the same QuantLib object.
+        """
+        date = to_ql_date(date)
+        key = date.serialNumber()
+        try:
+            # Try to return the implied curve if it is stored in self._implied_curves.
+            self._implied_curves.move_to_end(key)
+            return self._implied_curves[key]
+        except KeyError:
+            yield_curve = ql.ImpliedTermStructure(self._base_handle(), date)
+            curve_and_handle = (yield_curve, ql.YieldTermStructureHandle(yield_curve))
+            return _cache_store(self._implied_curves, key, curve_and_handle, self.cache_size)
+
+    def _discount_factors(self, serials):
+        """ Discount factors of the yield curve at ``self.base_date``, evaluated once per distinct date.
+
+        Parameters
+        ----------
+        serials: numpy.ndarray
+            QuantLib serial numbers of the dates.
+
+        Returns
+        -------
+        numpy.ndarray
+            The discount factors, with the same shape as `serials`.
+        """
+        serials = np.asarray(serials, dtype=np.int64)
+        offsets = serials - self._base_serial
+        if offsets.size:
+            self._grow_discounts(offsets.max())
+        # Gather whatever is already stored, then ask QuantLib only for the distinct dates still missing.
+        stored = offsets >= 0
+        discounts = np.full(serials.shape, np.nan)
+        discounts[stored] = self._discounts[offsets[stored]]
+        missing = np.isnan(discounts)
+        if missing.any():
+            unique_serials, inverse = np.unique(serials[missing], return_inverse=True)
+            discount = self._discount
+            discounts[missing] = np.array([discount(serial) for serial in unique_serials], dtype=np.float64)[inverse]
+        return discounts
+
+    def _year_fraction_cache(self, day_counter):
+
+        key = day_counter.name()
+        try:
+            return self._year_fraction_caches[key]
+        except KeyError:
+            cache = self._year_fraction_caches[key] = dict()
+            return cache
+
+    def _year_fraction(self, day_counter, start_serial, end_serial):
+
+        cache = self._year_fraction_cache(day_counter)
+        key = (start_serial, end_serial)
+        try:
+            return cache[key]
+        except KeyError:
+            time = cache[key] = day_counter.yearFraction(ql.Date(start_serial), ql.Date(end_serial))
+            return time
+
+    def _year_fractions(self, day_counter, start_serials, end_serials):
+
+        cache = self._year_fraction_cache(day_counter)
+        cache_get = cache.get
+        year_fraction = day_counter.yearFraction
+        ql_date = ql.Date
+        times = np.empty(start_serials.size, dtype=np.float64)
+        for i, key in enumerate(zip(start_serials.ravel().tolist(), end_serials.ravel().tolist())):
+            time = cache_get(key)
+            if time is None:
+                time = cache[key] = year_fraction(ql_date(key[0]), ql_date(key[1]))
+            times[i] = time
+        return times.reshape(start_serials.shape)
 
-    @conditional_vectorize('date', 'to_date')
     def zero_rate_to_date(self, date, to_date, compounding, frequency, extrapolate=True, day_counter=None):
         """
         Parameters
@@ -85,12 +290,154 @@ class ImpliedYieldCurveTimeSeries:
         -------
         scalar
             Zero rate for `to_date`, implied by the yield curve at `date`.
+
+        Note
+        ----
+        When `date` or `to_date` are iterables, the implied discount factors are taken from the yield curve at
+        ``self.base_date`` (once per distinct date) and the rates are computed over the whole array at once.
+        """
+        if not (isvectorizable(date) or isvectorizable(to_date)):
+            return self._zero_rate_to_date(date, to_date, compounding, frequency, extrapolate, day_counter)
+        meta = dict(date=date, to_date=to_date, compounding=compounding, frequency=frequency,
+                    extrapolate=extrapolate, day_counter=day_counter)
+        if not isvectorizable(date):
+            rates = self.zero_rate_to_date_vector(date=date, to_dates=to_date, compounding=compounding,
+                                                  frequency=frequency, extrapolate=extrapolate,
+                                                  day_counter=day_counter)
+            return ExtendedArray(rates, meta=meta) if rates.size else np.nan
+        dates, to_dates = np.broadcast_arrays(to_ql_date_serials(date), to_ql_date_serials(to_date))
+        if dates.size == 0:
+            return np.nan
+        rates = self._zero_rates(dates, to_dates, compounding, frequency, extrapolate, day_counter)
+        return ExtendedArray(rates, meta=meta)
+
+    def zero_rate_grid(self, dates, to_dates, compounding, frequency, extrapolate=True, day_counter=None):
+        """ Zero rates for every pair of curve date and maturity.
+
+        Parameters
+        ----------
+        dates: list-like of QuantLib.Date
+            Dates of the yield curve.
+        to_dates: list-like of QuantLib.Date
+            Maturities of the rates.
+        compounding: QuantLib.Compounding
+            Compounding convention for the rates.
+        frequency: QuantLib.Frequency
+            Frequency convention for the rates.
+        extrapolate: bool, optional
+            Whether to enable extrapolation.
+        day_counter: QuantLib.DayCounter, optional
+            The day counter for the calculation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape ``(len(dates), len(to_dates))``, where the element ``[i, j]`` is the zero rate for
+            ``to_dates[j]`` implied by the yield curve at ``dates[i]``.
+        """
+        date_serials = np.asarray(to_ql_date_serials(dates), dtype=np.int64).ravel()
+        to_serials = np.asarray(to_ql_date_serials(to_dates), dtype=np.int64).ravel()
+        grid_dates, grid_to_dates = np.broadcast_arrays(date_serials[:, np.newaxis], to_serials[np.newaxis, :])
+        if grid_dates.size == 0:
+            return np.empty(grid_dates.shape, dtype=np.float64)
+        return self._zero_rates(grid_dates, grid_to_dates, compounding, frequency, extrapolate, day_counter)
+
+    def _zero_rates(self, dates, to_dates, compounding, frequency, extrapolate=True, day_counter=None):
+        """ Zero rates for arrays of QuantLib serial numbers with the same shape.
+
+        Parameters
+        ----------
+        dates: numpy.ndarray
+            Serial numbers of the dates of the yield curve.
+        to_dates: numpy.ndarray
+            Serial numbers of the maturities of the rates.
+        compounding: QuantLib.Compounding
+            Compounding convention for the rates.
+        frequency: QuantLib.Frequency
+            Frequency convention for the rates.
+        extrapolate: bool, optional
+            Whether to enable extrapolation.
+        day_counter: QuantLib.DayCounter, optional
+            The day counter for the calculation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Zero rates with the same shape as `dates`.
+        """
+        day_counter = day_counter if day_counter is not None else self.day_counter
+        # The implied discount factor to 'to_date' at 'date' is base_discount(to_date) / base_discount(date).
+        date_discounts, to_date_discounts = self._discount_factors(np.stack((dates, to_dates)))
+        times = self._year_fractions(day_counter, dates, to_dates)
+        rates = _implied_rates(date_discounts / to_date_discounts, times, compounding, frequency)
+        # Rates QuantLib handles on its own (e.g. 'to_date' equal to 'date') or that need to raise an error for not
+        # allowing extrapolation are computed one by one.
+        missing = np.ones(dates.shape, dtype=bool) if rates is None else times <= 0
+        if not extrapolate:
+            missing |= to_dates > self._max_serial()
+        if missing.any():
+            rates = np.empty(dates.shape, dtype=np.float64) if rates is None else rates
+            rates[missing] = self._zero_rate_ufunc(dates[missing], to_dates[missing], compounding, frequency,
+                                                   extrapolate, day_counter)
+        return rates
+
+    def zero_rate_to_date_vector(self, date, to_dates, compounding, frequency, extrapolate=True, day_counter=None):
+        """ Zero rates for several maturities, implied by the yield curve at a single date.
+
+        Parameters
+        ----------
+        date: QuantLib.Date
+            Date of the yield curve.
+        to_dates: list-like of QuantLib.Date
+            Maturities of the rates.
+        compounding: QuantLib.Compounding
+            Compounding convention for the rates.
+        frequency: QuantLib.Frequency
+            Frequency convention for the rates.
+        extrapolate: bool, optional
+            Whether to enable extrapolation.
+        day_counter: QuantLib.DayCounter, optional
+            The day counter for the calculation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Zero rates for `to_dates`, implied by the yield curve at `date`.
         """
+        date_serial = to_ql_date_serials(date)
+        to_serials = np.asarray(to_ql_date_serials(to_dates), dtype=np.int64)
+        day_counter = day_counter if day_counter is not None else self.day_counter
+        times = self._year_fractions(day_counter, np.full(to_serials.shape, date_serial), to_serials)
+        # Implied discount factors are base discount factors relative to the base discount factor at 'date'.
+        discounts = self._discount_factors(to_serials)
+        rates = _implied_rates(self._discount(date_serial) / discounts, times, compounding, frequency)
+        missing = np.ones(times.shape, dtype=bool) if rates is None else times <= 0
+        if not extrapolate:
+            missing |= to_serials > self._max_serial()
+        if missing.any():
+            rates = np.empty(times.shape, dtype=np.float64) if rates is None else rates
+            rates[missing] = self._zero_rate_ufunc(date_serial, to_serials[missing], compounding, frequency,
+                                                   extrapolate, day_counter)
+        return rates
+
+    def _zero_rate_to_date(self, date, to_date, compounding, frequency, extrapolate=True, day_counter=None):
+
+        date = to_ql_date(date)
         to_date = to_ql_date(to_date)
         day_counter = day_counter if day_counter is not None else self.day_counter
+        if compounding == ql.Continuous:
+            date_serial, to_serial = date.serialNumber(), to_date.serialNumber()
+            time = self._year_fraction(day_counter, date_serial, to_serial)
+            if time > 0 and (extrapolate or to_serial <= self._max_serial()):
+                compound = self._discount(date_serial) / self._discount(to_serial)
+                return _continuous_rate(compound, time)
         return self.yield_curve(date).zeroRate(to_date, day_counter, compounding, frequency, extrapolate).rate()
 
-    @conditional_vectorize('date', 'to_date1', 'to_date2')
+    def _zero_rate_from_serials(self, date_serial, to_serial, compounding, frequency, extrapolate, day_counter):
+
+        return self._zero_rate_to_date(ql.Date(int(date_serial)), ql.Date(int(to_serial)), compounding, frequency,
+                                       extrapolate, day_counter)
+
     def forward_rate_date_to_date(self, date, to_date1, to_date2, compounding, frequency, extrapolate=True,
                                   day_counter=None):
         """
@@ -115,9 +462,59 @@ class ImpliedYieldCurveTimeSeries:
         -------
         scalar
             Forward rate between `to_date1` and `to_date2`, implied by the yield curve at `date`.
+
+        Note
+        ----
+        When any of the dates are iterables, the implied discount factors are taken from the yield curve at
+        ``self.base_date`` (once per distinct date) and the rates are computed over the whole array at once.
         """
+        if not (isvectorizable(date) or isvectorizable(to_date1) or isvectorizable(to_date2)):
+            return self._forward_rate_date_to_date(date, to_date1, to_date2, compounding, frequency, extrapolate,
+                                                   day_counter)
+        meta = dict(date=date, to_date1=to_date1, to_date2=to_date2, compounding=compounding, frequency=frequency,
+                    extrapolate=extrapolate, day_counter=day_counter)
+        dates, to_dates1, to_dates2 = np.broadcast_arrays(to_ql_date_serials(date), to_ql_date_serials(to_date1),
+                                                          to_ql_date_serials(to_date2))
+        if dates.size == 0:
+            return np.nan
+        day_counter = day_counter if day_counter is not None else self.day_counter
+        # The implied discount factor at 'date' cancels out in the forward rate between 'to_date1' and 'to_date2'.
+        discounts1, discounts2 = self._discount_factors(np.stack((to_dates1, to_dates2)))
+        times = self._year_fractions(day_counter, to_dates1, to_dates2)
+        rates = _implied_rates(discounts1 / discounts2, times, compounding, frequency)
+        # QuantLib raises for forward periods starting before 'date', so they are left to QuantLib too.
+        missing = np.ones(dates.shape, dtype=bool) if rates is None else (times <= 0) | (to_dates1 < dates)
+        if not extrapolate:
+            missing |= np.maximum(to_dates1, to_dates2) > self._max_serial()
+        if missing.any():
+            rates = np.empty(dates.shape, dtype=np.float64) if rates is None else rates
+            rates[missing] = self._forward_rate_ufunc(dates[missing], to_dates1[missing], to_dates2[missing],
+                                                      compounding, frequency, extrapolate, day_counter)
+        return ExtendedArray(rates, meta=meta)
+
+    def _forward_rate_date_to_date(self, date, to_date1, to_date2, compounding, frequency, extrapolate=True,
+                                   day_counter=None):
+
         to_date1 = to_ql_date(to_date1)
         to_date2 = to_ql_date(to_date2)
         day_counter = day_counter if day_counter is not None else self.day_counter
+        to_serial1, to_serial2 = to_date1.serialNumber(), to_date2.serialNumber()
+        time = self._year_fraction(day_counter, to_serial1, to_serial2)
+        if time > 0 and to_serial1 >= to_ql_date(date).serialNumber() and \
+                (extrapolate or to_serial2 <= self._max_serial()):
+            # The implied discount factor at 'date' cancels out, so the base discount factors are enough.
+            compound = self._discount(to_serial1) / self._discount(to_serial2)
+            if compounding == ql.Continuous:
+                return _continuous_rate(compound, time)
+            rate = _implied_rates(compound, time, compounding, frequency)
+            if rate is not None:
+                return float(rate)
         return self.yield_curve(date).forwardRate(to_date1, to_date2, day_counter, compounding, frequency,
                                                   extrapolate).rate()
+
+    def _forward_rate_from_serials(self, date_serial, to_serial1, to_serial2, compounding, frequency, extrapolate,
+                                   day_counter):
+
+        return self._forward_rate_date_to_date(ql.Date(int(date_serial)), ql.Date(int(to_serial1)),
+                                               ql.Date(int(to_serial2)), compounding, frequency, extrapolate,
+                                               day_counter)
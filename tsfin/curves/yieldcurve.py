@@ -115,37 +115,49 @@ class YieldCurveTimeSeries:
 
         """
         dates = to_list(dates)
+        for ts in self.ts_collection:
+            # Instruments that can look up the quotes of all the dates at once do it before the curves are built.
+            prepare_for_dates = getattr(ts, 'prepare_for_dates', None)
+            if prepare_for_dates is not None:
+                prepare_for_dates(dates=dates, **self.other_rate_helper_args)
 
-        for date in dates:
-            date = to_ql_date(date)
-            ql.Settings.instance().evaluationDate = date
-            helpers_dict = self._get_helpers(date)
-            # Instantiate the curve
-            helpers = [ndhelper.helper for ndhelper in helpers_dict.values()]
-            # Bootstrapping the nodes
-            yield_curve = to_ql_piecewise_curve(helpers=helpers,
-                                                calendar=self.calendar,
-                                                day_counter=self.day_counter,
-                                                curve_type=self.curve_type,
-                                                constraint_at_zero=self.constraint_at_zero)
-            # Here you can choose if you want to use the curve linked to the helpers or a frozen curve.
-            # Freezing the curve is needed when you are changing exclusively the global evaluation date,
-            # QuantLib helpers don't understand that only the evaluation date is changing and end up using
-            # the stored spot rates instead of the implied forward rates.
-            # Not freezing the curves is useful when you are changing the underlying prices of the helpers, this way
-            # the curve will update accordingly to the changes in the helpers.
-            if self.freeze_curves:
-                node_dates = yield_curve.dates()
-                node_rates = [yield_curve.zeroRate(node_date, self.day_counter, ql.Continuous, ql.NoFrequency).rate()
-                              for node_date in node_dates]
-                yield_curve = to_ql_interpolated_curve(node_dates=node_dates,
-                                                       node_rates=node_rates,
-                                                       day_counter=self.day_counter,
-                                                       calendar=self.calendar,
-                                                       interpolation_type=self.frozen_curve_interpolation_type)
-            if self.enable_extrapolation:
-                yield_curve.enableExtrapolation()
-            self.yield_curves[date] = yield_curve
+        try:
+            for date in dates:
+                date = to_ql_date(date)
+                ql.Settings.instance().evaluationDate = date
+                helpers_dict = self._get_helpers(date)
+                # Instantiate the curve
+                helpers = [ndhelper.helper for ndhelper in helpers_dict.values()]
+                # Bootstrapping the nodes
+                yield_curve = to_ql_piecewise_curve(helpers=helpers,
+                                                    calendar=self.calendar,
+                                                    day_counter=self.day_counter,
+                                                    curve_type=self.curve_type,
+                                                    constraint_at_zero=self.constraint_at_zero)
+                # Here you can choose if you want to use the curve linked to the helpers or a frozen curve.
+                # Freezing the curve is needed when you are changing exclusively the global evaluation date,
+                # QuantLib helpers don't understand that only the evaluation date is changing and end up using
+                # the stored spot rates instead of the implied forward rates.
+                # Not freezing the curves is useful when you are changing the underlying prices of the helpers, this
+                # way the curve will update accordingly to the changes in the helpers.
+                if self.freeze_curves:
+                    node_dates = yield_curve.dates()
+                    node_rates = [yield_curve.zeroRate(node_date, self.day_counter, ql.Continuous,
+                                                       ql.NoFrequency).rate() for node_date in node_dates]
+                    yield_curve = to_ql_interpolated_curve(node_dates=node_dates,
+                                                           node_rates=node_rates,
+                                                           day_counter=self.day_counter,
+                                                           calendar=self.calendar,
+                                                           interpolation_type=self.frozen_curve_interpolation_type)
+                if self.enable_extrapolation:
+                    yield_curve.enableExtrapolation()
+                self.yield_curves[date] = yield_curve
+        finally:
+            # The looked up quotes are only valid for this build, later builds may see updated quotes.
+            for ts in self.ts_collection:
+                clear_prepared_dates = getattr(ts, 'clear_prepared_dates', None)
+                if clear_prepared_dates is not None:
+                    clear_prepared_dates()
 
     def _update_all_curves(self):
         index = self.ts_collection[0].ts_values.index.tolist()
@@ -21,7 +21,7 @@ import QuantLib as ql
 import numpy as np
 from pprint import pformat
 from tsfin.constants import CALENDAR, CURRENCY, BASE_CURRENCY, COUNTRY, BASE_CALENDAR, QUOTES
-from tsfin.base import Instrument, to_ql_calendar, conditional_vectorize, to_upper_list
+from tsfin.base import Instrument, to_ql_calendar, to_upper_list, to_datetime, to_list, isvectorizable, ExtendedArray
 
 
 class Currency(Instrument):
@@ -42,26 +42,53 @@ class Currency(Instrument):
         self.base_calendar = to_ql_calendar(self.ts_attributes[BASE_CALENDAR])
         self.country = self.ts_attributes[COUNTRY]
 
-    @conditional_vectorize('date')
     def value(self, date, currency=None, last_available=False, *args, **kwargs):
 
-        currency = self.currency if currency is None else to_upper_list(currency)
-        if len(currency) != 3:
-            return np.nan
-        if self.currency == self.base_currency:
-            return 1
-        if currency == self.currency:
-            return self.quotes.get_values(index=date, last_available=last_available)
-        elif currency == self.base_currency:
-            return 1/self.quotes.get_values(index=date, last_available=last_available)
-        else:
-            return np.nan
+        return self._quote_value(quotes=self.quotes, date=date, currency=currency, last_available=last_available)
 
-    @conditional_vectorize('date')
     def risk_value(self, date, currency=None, last_available=False, *args, **kwargs):
 
         return self.value(date=date, currency=currency, last_available=last_available, *args, **kwargs)
 
+    def _quote_value(self, quotes, date, currency, last_available):
+        """ The value of the currency from its quotes, for a date or for all the dates in a list at once.
+
+        :param quotes: the currency quotes timeseries component.
+        :param date: date-like, list-like
+            The date(s).
+        :param currency: str, optional
+            The currency of the value.
+        :param last_available: bool
+            Whether to use last available data in case dates are missing in `quotes`.
+        :return: scalar, numpy.ndarray
+            The value, as an array when `date` is list-like.
+        """
+        currency = self.currency if currency is None else to_upper_list(currency)
+        if not isvectorizable(date):
+            if len(currency) != 3:
+                return np.nan
+            if self.currency == self.base_currency:
+                return 1
+            if currency == self.currency:
+                return quotes.get_values(index=date, last_available=last_available)
+            elif currency == self.base_currency:
+                return 1/quotes.get_values(index=date, last_available=last_available)
+            else:
+                return np.nan
+        dates = to_datetime(to_list(date))
+        if len(dates) == 0:
+            return np.nan
+        meta = dict(date=date, currency=currency, last_available=last_available)
+        if len(currency) == 3 and self.currency == self.base_currency:
+            return ExtendedArray(np.ones(len(dates)), meta=meta)
+        if len(currency) == 3 and currency in (self.currency, self.base_currency):
+            # All the quotes are looked up at once and inverted together.
+            values = np.asarray(quotes.get_values(index=dates, last_available=last_available), dtype=np.float64)
+            if currency != self.currency:
+                values = np.reciprocal(values)
+            return ExtendedArray(values, meta=meta)
+        return ExtendedArray(np.full(len(dates), np.nan), meta=meta)
+
     def security(self, date, currency=None, last_available=False, *args, **kwargs):
 
         currency = self.currency if currency is None else to_upper_list(currency)
@@ -105,26 +132,10 @@ class Cash(Currency):
                + '-' * 20 + '\n' \
                + '=' * 20 + '\n'
 
-    @conditional_vectorize('date')
     def value(self, date, currency=None, last_available=False, *args, **kwargs):
 
-        currency = self.currency if currency is None else to_upper_list(currency)
-        currency_quotes = self.currency_timeseries.quotes
-        if len(currency) != 3:
-            return np.nan
-        if self.currency == self.base_currency:
-            return 1
-        if currency == self.currency:
-            return currency_quotes.get_values(index=date, last_available=last_available)
-        elif currency == self.base_currency:
-            return 1/currency_quotes.get_values(index=date, last_available=last_available)
-        else:
-            return np.nan
-
-    @conditional_vectorize('date')
-    def risk_value(self, date, currency=None, last_available=False, *args, **kwargs):
-
-        return self.value(date=date, currency=currency, last_available=last_available, *args, **kwargs)
+        return self._quote_value(quotes=self.currency_timeseries.quotes, date=date, currency=currency,
+                                 last_available=last_available)
 
     def security(self, date, currency=None, last_available=False, *args, **kwargs):
 
@@ -1,3 +1,4 @@
 # Equities
 from tsfin.instruments.equities.equity import Equity
 from tsfin.instruments.equities.equityoption import EquityOption
+from tsfin.instruments.equities.optionchain import OptionChain
@@ -0,0 +1,109 @@
+# Copyright (C) 2016-2018 Lanx Capital Investimentos LTDA.
+#
+# This file is part of Time Series Finance (tsfin).
+#
+# Time Series Finance (tsfin) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# Time Series Finance (tsfin) is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Time Series Finance (tsfin). If not, see <https://www.gnu.org/licenses/>.
+"""
+NumPy implementation of the Leisen-Reimer binomial tree used by QuantLib's BinomialVanillaEngine.
+"""
+import numpy as np
+
+
+def peizer_pratt_inversion(z, n):
+    """ Peizer-Pratt method 2 inversion, the probability of an up move in the Leisen-Reimer tree.
+
+    :param z: float, numpy.ndarray
+        The normal quantile.
+    :param n: int
+        The number of steps of the tree.
+    :return: float, numpy.ndarray
+    """
+    result = z / (n + 1 / 3 + 0.1 / (n + 1))
+    result = np.exp(-result * result * (n + 1 / 6))
+    return 0.5 + np.where(z > 0, 1, -1) * np.sqrt(0.25 * (1 - result))
+
+
+def leisen_reimer(spot_price, strike, risk_free_rate, dividend_yield, volatility, time, steps, is_call, is_american):
+    """ Price, delta and gamma of vanilla options on Leisen-Reimer binomial trees with constant coefficients.
+
+    The whole layer of the tree is rolled back at once, with the early exercise condition applied on every layer for
+    American options. Delta and gamma are taken from the first layers of the tree, as in QuantLib. The payoff is always
+    applied at maturity, while QuantLib skips it for American options when its time grid rounds the last time below
+    the exercise time, that is when (time / steps) * steps < time in floating point, so QuantLib's prices are lower by
+    about the value of one step for those maturities (see tests/test_binomial.py).
+
+    The market arguments may be arrays (broadcast against each other), in which case the trees of all the options are
+    rolled back together, one row per option.
+
+    :param spot_price: float, array-like
+        The underlying spot price.
+    :param strike: float, array-like
+        The option strike.
+    :param risk_free_rate: float, array-like
+        The continuously compounded risk free rate to the option maturity.
+    :param dividend_yield: float, array-like
+        The continuously compounded dividend yield to the option maturity.
+    :param volatility: float, array-like
+        The Black volatility to the option maturity.
+    :param time: float, array-like
+        The time to maturity, in years.
+    :param steps: int
+        The number of steps of the tree, rounded up to an odd number.
+    :param is_call: bool, array-like
+        True for calls, False for puts.
+    :param is_american: bool
+        True for American exercise, False for European.
+    :return: tuple
+        The option price, delta and gamma, as floats if all the market arguments are scalars or numpy.ndarray
+        otherwise.
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(arg, dtype=np.float64) for arg in (spot_price, strike, risk_free_rate,
+                                                                                 dividend_yield, volatility, time,
+                                                                                 is_call)))
+    scalar = arrays[0].ndim == 0
+    spot_price, strike, risk_free_rate, dividend_yield, volatility, time, is_call = (arg.reshape(-1, 1)
+                                                                                     for arg in arrays)
+    steps = steps if steps % 2 else steps + 1
+    dt = time / steps
+    std_dev = volatility * np.sqrt(time)
+    d2 = (np.log(spot_price / strike) + (risk_free_rate - dividend_yield - 0.5 * volatility * volatility) * time) \
+        / std_dev
+    up_probability = peizer_pratt_inversion(d2, steps)
+    down_probability = 1 - up_probability
+    growth = np.exp((risk_free_rate - dividend_yield) * dt)
+    up = growth * peizer_pratt_inversion(d2 + std_dev, steps) / up_probability
+    down = (growth - up_probability * up) / down_probability
+    discount = np.exp(-risk_free_rate * dt)
+    sign = np.where(is_call, 1, -1)
+
+    nodes = np.arange(steps + 1)
+    underlying = spot_price * up ** nodes * down ** (steps - nodes)
+    values = np.maximum(sign * (underlying - strike), 0)
+    layers = dict()
+    for i in range(steps - 1, -1, -1):
+        values = discount * (up_probability * values[:, 1:] + down_probability * values[:, :-1])
+        underlying = underlying[:, :-1] / down
+        if is_american:
+            np.maximum(values, sign * (underlying - strike), out=values)
+        if i <= 2:
+            layers[i] = (underlying, values)
+
+    (s1_d, s1_u), (p1_d, p1_u) = (array.T for array in layers[1])
+    (s2_d, s2_m, s2_u), (p2_d, p2_m, p2_u) = (array.T for array in layers[2])
+    npv = values[:, 0]
+    delta = (p1_u - p1_d) / (s1_u - s1_d)
+    gamma = ((p2_u - p2_m) / (s2_u - s2_m) - (p2_m - p2_d) / (s2_m - s2_d)) / ((s2_u - s2_d) / 2)
+    if scalar:
+        return float(npv[0]), float(delta[0]), float(gamma[0])
+    return npv.reshape(arrays[0].shape), delta.reshape(arrays[0].shape), gamma.reshape(arrays[0].shape)
@@ -0,0 +1,168 @@
+# Copyright (C) 2016-2018 Lanx Capital Investimentos LTDA.
+#
+# This file is part of Time Series Finance (tsfin).
+#
+# Time Series Finance (tsfin) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# Time Series Finance (tsfin) is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Time Series Finance (tsfin). If not, see <https://www.gnu.org/licenses/>.
+"""
+NumPy implementation of the Black formula and of its implied volatility, for European options.
+"""
+import numpy as np
+from scipy.special import ndtr
+
+SQRT_2_PI = np.sqrt(2 * np.pi)
+
+
+def _black_call(forward, strike, std_dev):
+    """ Undiscounted Black call price and its derivative with respect to the standard deviation. """
+    d1 = np.log(forward / strike) / std_dev + 0.5 * std_dev
+    price = forward * ndtr(d1) - strike * ndtr(d1 - std_dev)
+    return price, forward * np.exp(-0.5 * d1 * d1) / SQRT_2_PI
+
+
+def black_price(forward, strike, std_dev, discount, is_call):
+    """ Black formula price of European options.
+
+    :param forward: float, array-like
+        The forward price of the underlying to the option maturity.
+    :param strike: float, array-like
+        The option strike.
+    :param std_dev: float, array-like
+        The volatility times the square root of the time to maturity.
+    :param discount: float, array-like
+        The risk free discount factor to the option maturity.
+    :param is_call: bool, array-like
+        True for calls, False for puts.
+    :return: float, numpy.ndarray
+        The option price, as a float if all the arguments are scalars or numpy.ndarray otherwise.
+    """
+    forward, strike, std_dev, discount, is_call = np.broadcast_arrays(
+        *(np.asarray(arg, dtype=np.float64) for arg in (forward, strike, std_dev, discount, is_call)))
+    sign = np.where(is_call, 1.0, -1.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        call, _ = _black_call(forward, strike, std_dev)
+    # Puts by the put-call parity, options without volatility are worth their discounted intrinsic value.
+    price = np.where(std_dev > 0, call - np.where(is_call, 0.0, forward - strike),
+                     np.maximum(sign * (forward - strike), 0.0))
+    price = discount * price
+    return float(price) if price.ndim == 0 else price
+
+
+def black_scholes_greeks(spot_price, strike, discount, dividend_discount, volatility, volatility_time, rate_time,
+                         is_call):
+    """ Price and Greeks of European options with the Black Scholes Merton formula, as QuantLib's
+    AnalyticEuropeanEngine calculates them.
+
+    :param spot_price: float, array-like
+        The underlying spot price.
+    :param strike: float, array-like
+        The option strike.
+    :param discount: float, array-like
+        The risk free discount factor to the option maturity.
+    :param dividend_discount: float, array-like
+        The dividend yield discount factor to the option maturity.
+    :param volatility: float, array-like
+        The Black volatility to the option maturity.
+    :param volatility_time: float, array-like
+        The time to maturity of the volatility, in years.
+    :param rate_time: float, array-like
+        The time to maturity of the risk free curve, in years.
+    :param is_call: bool, array-like
+        True for calls, False for puts.
+    :return: tuple
+        The option price, delta, gamma, theta, vega and rho, as floats if all the arguments are scalars or
+        numpy.ndarray otherwise.
+    """
+    spot_price, strike, discount, dividend_discount, volatility, volatility_time, rate_time, is_call = \
+        np.broadcast_arrays(*(np.asarray(arg, dtype=np.float64) for arg in (spot_price, strike, discount,
+                                                                            dividend_discount, volatility,
+                                                                            volatility_time, rate_time, is_call)))
+    sign = np.where(is_call, 1.0, -1.0)
+    forward = spot_price * dividend_discount / discount
+    std_dev = volatility * np.sqrt(volatility_time)
+    d1 = np.log(forward / strike) / std_dev + 0.5 * std_dev
+    n1 = ndtr(sign * d1)
+    n2 = ndtr(sign * (d1 - std_dev))
+    density = np.exp(-0.5 * d1 * d1) / SQRT_2_PI
+    price = discount * sign * (forward * n1 - strike * n2)
+    delta = sign * dividend_discount * n1
+    gamma = dividend_discount * density / (spot_price * std_dev)
+    # QuantLib's BlackCalculator theta, from the price, delta and gamma by the Black Scholes equation.
+    theta = -(np.log(discount) * price + np.log(forward / spot_price) * spot_price * delta
+              + 0.5 * std_dev * std_dev * spot_price * spot_price * gamma) / volatility_time
+    vega = discount * forward * density * np.sqrt(volatility_time)
+    rho = sign * rate_time * discount * strike * n2
+    if price.ndim == 0:
+        return float(price), float(delta), float(gamma), float(theta), float(vega), float(rho)
+    return price, delta, gamma, theta, vega, rho
+
+
+def black_implied_volatility(price, forward, strike, discount, time, is_call, min_volatility=1.0e-7,
+                             max_volatility=4.0, accuracy=1.0e-12, max_iterations=100):
+    """ Implied volatility of European options from their prices, with the Black formula.
+
+    All the options are solved together. Put prices are turned into call prices by the put-call parity, and the
+    standard deviation is found by Newton iterations starting from the inflection point of the Black call price,
+    falling back to bisection whenever a step leaves the bracket of the root.
+
+    :param price: float, array-like
+        The option price.
+    :param forward: float, array-like
+        The forward price of the underlying to the option maturity.
+    :param strike: float, array-like
+        The option strike.
+    :param discount: float, array-like
+        The risk free discount factor to the option maturity.
+    :param time: float, array-like
+        The time to maturity of the volatility, in years.
+    :param is_call: bool, array-like
+        True for calls, False for puts.
+    :param min_volatility: float
+        The lowest volatility accepted, as in QuantLib's impliedVolatility.
+    :param max_volatility: float
+        The highest volatility accepted, as in QuantLib's impliedVolatility.
+    :param accuracy: float
+        The tolerance of the standard deviation.
+    :param max_iterations: int
+        The maximum number of iterations.
+    :return: float, numpy.ndarray
+        The implied volatility, NaN for prices outside the range of the volatility bounds. A float if all the
+        arguments are scalars or numpy.ndarray otherwise.
+    """
+    price, forward, strike, discount, time, is_call = np.broadcast_arrays(
+        *(np.asarray(arg, dtype=np.float64) for arg in (price, forward, strike, discount, time, is_call)))
+    scalar = price.ndim == 0
+    price, forward, strike, discount, time, is_call = (arg.ravel() for arg in (price, forward, strike, discount,
+                                                                               time, is_call))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        call = price / discount + np.where(is_call, 0.0, forward - strike)
+        low = min_volatility * np.sqrt(time)
+        high = max_volatility * np.sqrt(time)
+        solvable = (time > 0) & (_black_call(forward, strike, low)[0] <= call) \
+            & (call <= _black_call(forward, strike, high)[0])
+        std_dev = np.clip(np.sqrt(2 * np.abs(np.log(forward / strike))), low, high)
+        for _ in range(max_iterations):
+            value, vega = _black_call(forward, strike, std_dev)
+            value -= call
+            low = np.where(value < 0, std_dev, low)
+            high = np.where(value > 0, std_dev, high)
+            new_std_dev = std_dev - value / vega
+            new_std_dev = np.where((new_std_dev > low) & (new_std_dev < high), new_std_dev, 0.5 * (low + high))
+            converged = ~solvable | (np.abs(new_std_dev - std_dev) <= accuracy) | (value == 0)
+            std_dev = np.where(value == 0, std_dev, new_std_dev)
+            if converged.all():
+                break
+        volatility = np.where(solvable, std_dev / np.sqrt(time), np.nan)
+    if scalar:
+        return float(volatility[0])
+    return volatility
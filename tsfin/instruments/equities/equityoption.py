@@ -17,8 +17,12 @@
 """
 A class for modelling Equity Options
 """
+import multiprocessing
+import os
 import QuantLib as ql
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from functools import wraps
 from tsio import TimeSeries, TimeSeriesCollection
 from tsfin.constants import CALENDAR, MATURITY_DATE, DAY_COUNTER, EXERCISE_TYPE, OPTION_TYPE, STRIKE_PRICE, \
@@ -26,7 +30,89 @@ from tsfin.constants import CALENDAR, MATURITY_DATE, DAY_COUNTER, EXERCISE_TYPE,
     HESTON, GJR_GARCH, MID_PRICE, IMPLIED_VOL, UNADJUSTED_PRICE, DIVIDEND_YIELD
 from tsfin.base import Instrument, to_ql_date, conditional_vectorize, to_ql_calendar, to_ql_day_counter, to_datetime, \
     to_list, to_ql_option_type, to_ql_one_asset_option, to_ql_option_payoff, to_ql_option_engine, \
-    to_ql_option_exercise_type
+    to_ql_option_exercise_type, to_ql_date_serials, isvectorizable, BINOMIAL_TIME_STEPS, EPOCH_SERIAL_NUMBER, \
+    ExtendedArray
+from tsfin.instruments.equities._binomial import leisen_reimer
+from tsfin.instruments.equities._black import black_implied_volatility, black_scholes_greeks
+
+GREEKS = ('price', 'delta', 'gamma', 'theta', 'vega', 'rho')
+# Maximum number of dates with a stored implied volatility, per option.
+IMPLIED_VOLATILITY_CACHE_SIZE = 10000
+# Accuracy and maximum evaluations of the European implied volatilities, the same for QuantLib and the NumPy solver
+# so the volatility of a date doesn't depend on which one found it.
+EUROPEAN_IMPLIED_VOLATILITY_ACCURACY = 1.0e-12
+EUROPEAN_IMPLIED_VOLATILITY_MAX_EVALUATIONS = 100
+# Maximum number of pricing engines stored by engine name, exercise type, tree steps and process, per option.
+ENGINE_CACHE_SIZE = 256
+# Maximum number of market states with stored prices and Greeks, per option.
+GREEKS_CACHE_SIZE = 4096
+# NumPy pricing kernels and the values each one calculates, in the order it returns them.
+BINOMIAL_TREE = 'BINOMIAL_TREE'
+BLACK_SCHOLES_FORMULA = 'BLACK_SCHOLES_FORMULA'
+KERNEL_GREEKS = {BINOMIAL_TREE: ('price', 'delta', 'gamma'),
+                 BLACK_SCHOLES_FORMULA: ('price', 'delta', 'gamma', 'theta', 'vega', 'rho')}
+
+
+def _serials_to_datetime(serials):
+    """ Convert QuantLib serial numbers to a pandas.DatetimeIndex, without building a QuantLib.Date for each one. """
+    return to_datetime((serials - EPOCH_SERIAL_NUMBER).astype('datetime64[D]'))
+
+
+# The option priced by the worker processes of EquityOption.price_many and its overrides, inherited from the parent
+# when forked.
+_worker_option = None
+_worker_kwargs = None
+
+
+def _set_worker_option(option, kwargs):
+    """ Keep the option a worker process of :py:meth:`EquityOption.price_many` prices, with its overrides. """
+    global _worker_option, _worker_kwargs
+    _worker_option = option
+    _worker_kwargs = kwargs
+
+
+def _worker_prices(dates):
+    """ The prices of the worker process option at dates, a numpy.ndarray of numpy.datetime64. """
+    return _worker_option.greeks(date=dates, greeks=('price',), **_worker_kwargs)['price']
+
+
+def _stack(dicts):
+    """ Stack a list of dicts with the same keys into a dict of numpy.ndarray. """
+    return {key: np.array([values[key] for values in dicts]) for key in dicts[0]}
+
+
+def _kernel_values(kernel, inputs):
+    """ The values of a NumPy pricing kernel.
+
+    :param kernel: str
+        The kernel name, a key of KERNEL_GREEKS.
+    :param inputs: dict
+        The kernel keyword arguments, scalars or arrays with one element per option.
+    :return: dict
+        The values by name in KERNEL_GREEKS[kernel].
+    """
+    if kernel == BINOMIAL_TREE:
+        inputs = dict(inputs)
+        # The options of a batch share the number of steps, see _kernel_batches.
+        steps = int(np.max(inputs.pop('steps')))
+        values = leisen_reimer(steps=steps, is_american=True, **inputs)
+    else:
+        values = black_scholes_greeks(**inputs)
+    return dict(zip(KERNEL_GREEKS[kernel], values))
+
+
+def _kernel_batches(rows, kernel_inputs):
+    """ Group the (kernel, inputs) pairs collected for the rows of a result by kernel and number of tree steps.
+
+    :return: dict
+        The rows and the stacked inputs, by kernel name and number of steps (None for the other kernels).
+    """
+    batches = dict()
+    for row, (kernel, inputs) in zip(rows, kernel_inputs):
+        batch_rows, batch_inputs = batches.setdefault((kernel, inputs.get('steps')), (list(), list()))
+        batch_rows.append(row)
+        batch_inputs.append(inputs)
+    return {key: (batch_rows, _stack(batch_inputs)) for key, (batch_rows, batch_inputs) in batches.items()}
 
 
 def option_default_values(f):
@@ -146,17 +232,29 @@ class EquityOption(Instrument):
     ----
     See the :py:mod:`constants` for required attributes in `timeseries` and their possible values.
     """
+    # Portfolios hold thousands of options, so instances keep their attributes in slots instead of a __dict__.
+    __slots__ = ('option_type', '_is_call', '_sign', 'strike', 'contract_size', '_maturity', '_maturity_serial',
+                 'calendar', 'day_counter', 'exercise_type', 'underlying_name', '_settings', 'earliest_date',
+                 'exercise', 'payoff', 'option', '_options', 'risk_free_yield_curve_ts', 'underlying_instrument',
+                 'engine_name', 'binomial_time_steps', 'binomial_tree_kernel', '_engines', '_greek_values',
+                 '_engine_type', '_missing_greeks', 'base_equity_process', '_implied_volatility',
+                 '_implied_volatility_prices', '_first_available_date')
 
     def __init__(self, timeseries):
         super().__init__(timeseries=timeseries)
         self.option_type = self.ts_attributes[OPTION_TYPE]
+        self._is_call = self.option_type == 'CALL'
+        # Sign of the payoff, zero for option types without an intrinsic value.
+        self._sign = 1.0 if self._is_call else -1.0 if self.option_type == 'PUT' else 0.0
         self.strike = float(self.ts_attributes[STRIKE_PRICE])
         self.contract_size = float(self.ts_attributes[CONTRACT_SIZE])
         self._maturity = to_ql_date(to_datetime(self.ts_attributes[MATURITY_DATE]))
+        self._maturity_serial = self._maturity.serialNumber()
         self.calendar = to_ql_calendar(self.ts_attributes[CALENDAR])
         self.day_counter = to_ql_day_counter(self.ts_attributes[DAY_COUNTER])
-        self.exercise_type = self.ts_attributes[EXERCISE_TYPE]
+        self.exercise_type = str(self.ts_attributes[EXERCISE_TYPE]).upper()
         self.underlying_name = self.ts_attributes[UNDERLYING_INSTRUMENT]
+        self._settings = ql.Settings.instance()
         try:
             self.earliest_date = to_ql_date(self.ts_attributes[EARLIEST_DATE])
         except KeyError:
@@ -165,21 +263,50 @@ class EquityOption(Instrument):
         self.payoff = to_ql_option_payoff(self.ts_attributes[PAYOFF_TYPE], to_ql_option_type(self.option_type),
                                           self.strike)
         self.option = to_ql_one_asset_option(self.payoff, self.exercise)
+        # The payoff never changes, so exercises and options are built once per exercise type.
+        self._options = {self.exercise_type: (self.exercise, self.option)}
         self.risk_free_yield_curve_ts = None
         self.underlying_instrument = None
         # engine setup
         self.engine_name = 'FINITE_DIFFERENCES'
+        # Steps of the Leisen-Reimer tree of the 'BINOMIAL_VANILLA' engine, fewer steps trade accuracy for speed.
+        self.binomial_time_steps = BINOMIAL_TIME_STEPS
+        # When True, American options under the 'BINOMIAL_VANILLA' engine with a Black Scholes process get their price,
+        # delta and gamma from the NumPy Leisen-Reimer tree instead of QuantLib's engine.
+        self.binomial_tree_kernel = False
+        # Engines only observe the process handles, so the one built for a process is reused on every date.
+        self._engines = OrderedDict()
+        # Prices and Greeks of the analytic European engine by the market state they were calculated at, for
+        # scenarios repeating the same inputs.
+        self._greek_values = OrderedDict()
+        # Greeks each type of QuantLib engine doesn't calculate, found on the first failed call, so later calls go
+        # straight to the numerical fallback.
+        self._engine_type = None
+        self._missing_greeks = dict()
         self.base_equity_process = None
-        self._implied_volatility = dict()
+        self._implied_volatility = OrderedDict()
         self._implied_volatility_prices = dict()
+        self._first_available_date = None
+
+    @property
+    def first_available_date(self):
+        """ The first date with a mid price in the option timeseries, looked up once.
+
+        :return: datetime-like
+        """
+        if self._first_available_date is None:
+            self._first_available_date = getattr(self.timeseries, MID_PRICE).ts_values.first_valid_index()
+        return self._first_available_date
 
     def change_exercise_type(self, exercise_type):
 
         exercise_type = str(exercise_type).upper()
-        self.exercise = to_ql_option_exercise_type(exercise_type, self.earliest_date, self._maturity)
-        self.payoff = to_ql_option_payoff(self.ts_attributes[PAYOFF_TYPE], to_ql_option_type(self.option_type),
-                                          self.strike)
-        self.option = to_ql_one_asset_option(self.payoff, self.exercise)
+        self.exercise_type = exercise_type
+        options = self._options.get(exercise_type)
+        if options is None:
+            exercise = to_ql_option_exercise_type(exercise_type, self.earliest_date, self._maturity)
+            options = self._options[exercise_type] = (exercise, to_ql_one_asset_option(self.payoff, exercise))
+        self.exercise, self.option = options
 
     def set_yield_curve(self, risk_free_yield_curve_ts):
 
@@ -207,6 +334,16 @@ class EquityOption(Instrument):
         :return:
         """
         self.base_equity_process = base_equity_process(calendar=self.calendar, day_counter=self.day_counter, **kwargs)
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """ Drop the pricing engines built for the processes of the previous :py:class:'BaseEquityProcess' and the
+        stored prices and Greeks. Call it after changing the market data of a date already priced.
+
+        :return:
+        """
+        self._engines.clear()
+        self._greek_values.clear()
 
     def set_pricing_engine(self, ql_engine=None, engine_name=None, process=None, *args, **kwargs):
         """
@@ -220,13 +357,38 @@ class EquityOption(Instrument):
         :return:
         """
         if ql_engine is not None:
-            self.option.setPricingEngine(ql_engine)
-        elif engine_name is not None and process is not None:
-            option_engine = to_ql_option_engine(engine_name=engine_name, process=process)
-            self.option.setPricingEngine(option_engine)
+            option_engine = ql_engine
         else:
-            option_engine = to_ql_option_engine(engine_name=self.engine_name, process=process)
-            self.option.setPricingEngine(option_engine)
+            if engine_name is None or process is None:
+                engine_name = self.engine_name
+            option_engine = self._pricing_engine(engine_name=engine_name, process=process)
+        self.option.setPricingEngine(option_engine)
+        self._engine_type = type(option_engine)
+
+    def _pricing_engine(self, engine_name, process):
+        """ The pricing engine for the process, built once per engine name, exercise type, number of tree steps and
+        process.
+
+        :param engine_name: str
+            The QuantLib pricing engine name
+        :param process: QuantLib.StochasticProcess
+            The QuantLib object with the option Stochastic Process.
+        :return: QuantLib.PricingEngine
+        """
+        key = (engine_name, self.exercise_type, self.binomial_time_steps, id(process))
+        try:
+            # The process is stored along with the engine, so its id can't be reused while the key is in the cache.
+            _, option_engine = self._engines[key]
+        except KeyError:
+            option_engine = to_ql_option_engine(engine_name=engine_name, process=process,
+                                                exercise_type=self.exercise_type,
+                                                time_steps=self.binomial_time_steps)
+            self._engines[key] = (process, option_engine)
+            while len(self._engines) > ENGINE_CACHE_SIZE:
+                self._engines.popitem(last=False)
+            return option_engine
+        self._engines.move_to_end(key)
+        return option_engine
 
     @option_default_values
     def security(self, date, base_date, spot_price, volatility, dividend_yield, dividend_tax, base_equity_process,
@@ -269,8 +431,7 @@ class EquityOption(Instrument):
         :return bool
             True if the instrument is expired or matured, False otherwise.
         """
-        date = to_ql_date(date)
-        if date >= self._maturity:
+        if to_ql_date_serials(date) >= self._maturity_serial:
             return True
         return False
 
@@ -298,24 +459,25 @@ class EquityOption(Instrument):
         :param kwargs:
         :return: list of tuples (date, date, value)
         """
-        start_date = to_ql_date(start_date)
-        date = to_ql_date(date)
-        if start_date <= self._maturity <= date:
+        start_serial = to_ql_date_serials(start_date)
+        serial = to_ql_date_serials(date)
+        if start_serial <= self._maturity_serial <= serial:
             intrinsic = self.intrinsic(self._maturity, spot_price)
             return [(self._maturity, self._maturity, intrinsic*self.contract_size)]
         else:
             return []
 
-    @conditional_vectorize('date', 'quote', 'volatility')
-    @option_default_values
-    def value(self, date, base_date, quote, volatility, dividend_tax, last_available, *args, **kwargs):
+    def value(self, date, base_date=None, quote=None, volatility=None, dividend_tax=None, last_available=None,
+              **kwargs):
         """Try to deduce dirty value for a unit of the time series (as a financial instrument).
 
-        :param date: date-like
-            The date.
+        Without a quote the value is given by the option mid price, looked up for all the dates at once.
+
+        :param date: date-like, list-like
+            The date(s).
         :param base_date: date-like
             When date is a future date base_date is the last date on the "present" used to estimate future values.
-        :param quote: scalar, optional
+        :param quote: scalar, array-like, optional
             The quote.
         :param volatility: float, optional
             Volatility override value to calculate the option.
@@ -323,22 +485,29 @@ class EquityOption(Instrument):
             The dividend % tax applied.
         :param last_available: bool, optional
             Whether to use last available data in case dates are missing in ``quotes``.
-        :return scalar, None
+        :return scalar, numpy.ndarray
             The unit dirty value of the instrument.
         """
-        size = self.contract_size
-        if quote is not None:
-            return float(quote)*size
-        else:
-            price = self.price(date=date, base_date=base_date, dividend_tax=dividend_tax,
-                               last_available=last_available, volatility=volatility,
-                               bypass_option_default_values=True, **kwargs)
-        return price * size
-
-    @conditional_vectorize('date', 'spot_price', 'volatility')
-    @option_default_values
-    def risk_value(self, date, base_date, spot_price, dividend_yield, dividend_tax, volatility, base_equity_process,
-                   **kwargs):
+        vectorized = [arg for arg in (date, quote, volatility) if isvectorizable(arg)]
+        if any(len(arg) == 0 for arg in vectorized):
+            return np.nan
+        meta = dict(kwargs, date=date, base_date=base_date, quote=quote, volatility=volatility,
+                    dividend_tax=dividend_tax, last_available=last_available)
+        if quote is None:
+            quote = kwargs.get('option_price')
+        if quote is None:
+            serials = np.atleast_1d(to_ql_date_serials(date))
+            quote = self._ts_values_bulk(serials=serials, base_date=base_date, last_available=last_available,
+                                         spot_price=0, dividend_yield=0)['option_price']
+            if not isvectorizable(date):
+                quote = quote[0]
+        if not vectorized:
+            return float(quote) * self.contract_size
+        shape = np.broadcast_shapes(*(np.shape(arg) for arg in vectorized))
+        return ExtendedArray(np.broadcast_to(np.asarray(quote, dtype=np.float64), shape) * self.contract_size,
+                             meta=meta)
+
+    def risk_value(self, date, **kwargs):
         """ Return the option delta notional value
 
         :param date: date-like
@@ -358,13 +527,8 @@ class EquityOption(Instrument):
         :return: float
             The option delta notional value.
         """
-        delta = self.delta(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
-                           dividend_tax=dividend_tax, volatility=volatility,
-                           base_equity_process=base_equity_process,
-                           bypass_option_default_values=True, **kwargs)
-        return delta*spot_price*self.contract_size
+        return self._delta_notional(date=date, **kwargs)
 
-    @conditional_vectorize('date', 'quote')
     def performance(self, date=None, quote=None, start_date=None, start_quote=None, *args, **kwargs):
         """ Return the performance between the start_date and date
 
@@ -383,14 +547,46 @@ class EquityOption(Instrument):
         :return scalar, None
             Performance of a unit of the option.
         """
-        first_available_date = getattr(self.timeseries, MID_PRICE).ts_values.first_valid_index()
+        first_available_date = self.first_available_date
         if start_date is None:
             start_date = first_available_date
         if start_date < first_available_date:
             start_date = first_available_date
+        if quote is None and not args and isvectorizable(date):
+            # The start value is calculated once and the values of all the dates after it together.
+            serials = np.atleast_1d(to_ql_date_serials(date))
+            if len(serials) == 0:
+                return np.nan
+            performance = np.full(len(serials), np.nan)
+            after_start = serials >= to_ql_date_serials(start_date)
+            if after_start.any():
+                start_value = self.value(date=start_date, **kwargs)
+                dates = (serials[after_start] - EPOCH_SERIAL_NUMBER).astype('datetime64[D]')
+                performance[after_start] = self.value(date=dates, **kwargs) / start_value - 1
+            return ExtendedArray(performance, meta=dict(kwargs, date=date, quote=quote, start_date=start_date))
+        return self._performance(date=date, quote=quote, start_date=start_date, start_values=dict(), *args, **kwargs)
+
+    @conditional_vectorize('date', 'quote')
+    def _performance(self, date, quote, start_date, start_values, *args, **kwargs):
+        """ Return the performance between the start_date and date, with the start value stored by quote.
+
+        :param date: datetime-like, (c-vectorized)
+            The ending date of the period.
+        :param quote: scalar, (c-vectorized)
+            The quote of the instrument in `date`.
+        :param start_date: datetime-like
+            The starting date of the period, not before the first available date.
+        :param start_values: dict
+            The values at `start_date` already calculated, by quote.
+        :return scalar
+            Performance of a unit of the option.
+        """
         if date < start_date:
             return np.nan
-        start_value = self.value(date=start_date, quote=quote, *args, **kwargs)
+        try:
+            start_value = start_values[quote]
+        except KeyError:
+            start_value = start_values[quote] = self.value(date=start_date, quote=quote, *args, **kwargs)
         value = self.value(date=date, quote=quote, *args, **kwargs)
 
         return (value / start_value) - 1
@@ -405,26 +601,36 @@ class EquityOption(Instrument):
 
     def intrinsic(self, date, spot_price):
         """
-        :param date: date-like
-            The date
-        :param spot_price: float
-            The underlying spot price.
-        :return: float
+        :param date: date-like, list-like
+            The date(s).
+        :param spot_price: float, array-like
+            The underlying spot price(s).
+        :return: float, numpy.ndarray
             The intrinsic value o the option at date.
         """
-        if date > self._maturity:
+        if isvectorizable(date) or isvectorizable(spot_price):
+            return self._intrinsic_array(dates=date, spot_prices=spot_price)
+        if to_ql_date_serials(date) > self._maturity_serial:
             return 0
-        else:
-            intrinsic = 0
-            if self.option_type == 'CALL':
-                intrinsic = spot_price - self.strike
-            elif self.option_type == 'PUT':
-                intrinsic = self.strike - spot_price
-            if intrinsic < 0:
-                return 0
-            else:
-                return intrinsic
-    
+        return max(0, self._sign * (spot_price - self.strike))
+
+    def _intrinsic_array(self, dates, spot_prices=None):
+        """
+        :param dates: date-like, list-like
+            The dates.
+        :param spot_prices: float, array-like, optional
+            The underlying spot prices.
+            Default: the underlying instrument unadjusted prices at `dates`, with the last available data.
+        :return: numpy.ndarray
+            The intrinsic values of the option at dates.
+        """
+        serials = np.asarray(to_ql_date_serials(dates))
+        if spot_prices is None:
+            spot_prices = getattr(self.underlying_instrument, UNADJUSTED_PRICE).get_values(
+                index=_serials_to_datetime(np.atleast_1d(serials)), last_available=True)
+        intrinsic = np.maximum(0.0, self._sign * (np.asarray(spot_prices, dtype=np.float64) - self.strike))
+        return np.where(serials > self._maturity_serial, 0.0, intrinsic)
+
     def ts_mid_price(self, date, last_available=True, fill_value=np.nan):
 
         date = to_datetime(to_list(date))
@@ -437,6 +643,41 @@ class EquityOption(Instrument):
         return getattr(self.timeseries, IMPLIED_VOL).get_values(index=date, last_available=last_available,
                                                                 fill_value=fill_value)
 
+    def _ts_values_bulk(self, serials, base_date=None, last_available=None, underlying_instrument=None,
+                        option_price=None, spot_price=None, dividend_yield=None, **kwargs):
+        """ The option and underlying timeseries values :py:func:`option_default_values` would look up, for all the
+        dates at once.
+
+        :param serials: numpy.ndarray
+            The QuantLib serial numbers of the dates.
+        :param base_date: date-like, optional
+            When date is a future date base_date is the last date on the "present" used to estimate future values.
+        :param last_available: bool, optional
+            Whether to use last available data.
+        :return: dict
+            numpy.ndarray of the option_price, spot_price and dividend_yield not given as overrides.
+        """
+        if underlying_instrument is not None:
+            # option_default_values sets a new underlying instrument, so the values are left for it to look up.
+            return dict()
+        if base_date is not None:
+            serials = np.minimum(serials, to_ql_date_serials(base_date))
+        last = True if last_available is None else last_available
+        # Dates after base_date all look up base_date, so each date is looked up only once.
+        serials, positions = np.unique(serials, return_inverse=True)
+        dates = _serials_to_datetime(serials)
+        ts_values = dict()
+        if option_price is None:
+            ts_values['option_price'] = getattr(self.timeseries, MID_PRICE).get_values(index=dates,
+                                                                                       last_available=last)
+        if spot_price is None:
+            ts_values['spot_price'] = getattr(self.underlying_instrument, UNADJUSTED_PRICE).get_values(
+                index=dates, last_available=last)
+        if dividend_yield is None:
+            ts_values['dividend_yield'] = getattr(self.underlying_instrument, DIVIDEND_YIELD).get_values(
+                index=dates, last_available=last)
+        return {name: np.asarray(values)[positions] for name, values in ts_values.items()}
+
     def _process_values_update(self, base_equity_process, date, base_date, spot_price, dividend_yield, dividend_tax,
                                risk_free_yield_curve_ts):
         """
@@ -464,7 +705,7 @@ class EquityOption(Instrument):
         base_equity_process.dividend_yield.setValue(dividend_yield)
         base_equity_process.spot_price.setValue(spot_price)
 
-    def _black_implied_vol(self, date, option_price, spot_price, base_equity_process, engine_name):
+    def _black_implied_vol(self, date, option_price, spot_price, base_equity_process):
         """
         :param date: QuantLib.Date
             The date.
@@ -472,23 +713,25 @@ class EquityOption(Instrument):
             The underlying spot price.
         :param option_price: float
             The option price used to calculate the implied volatility.
-        :param engine_name: str
-            The QuantLib pricing engine name
         """
 
-        if date in self._implied_volatility.keys():
-            if option_price == self._implied_volatility_prices[date]:
+        if date in self._implied_volatility:
+            if option_price == self._implied_volatility_prices.get(date):
                 # if the function reaches this step it means it has already calculated the volatility once for the
                 # given option price.
+                self._implied_volatility.move_to_end(date)
                 return
 
-        self._implied_volatility[date] = ql.SimpleQuote(0.2)
+        self._store_implied_volatility(date=date, volatility=0.2)
         self._implied_volatility_prices[date] = option_price
-        process = base_equity_process.process(volatility=self._implied_volatility[date])
-        self.set_pricing_engine(engine_name=engine_name, process=process)
-
+        process = base_equity_process.process(volatility=base_equity_process.volatility)
+        # impliedVolatility builds its own engine and volatility quote, the option engine is set by volatility_update
+        # afterwards. Its arguments are positional, newer QuantLib versions don't accept them by keyword.
+        solver_args = tuple()
+        if self.exercise_type == 'EUROPEAN':
+            solver_args = (EUROPEAN_IMPLIED_VOLATILITY_ACCURACY, EUROPEAN_IMPLIED_VOLATILITY_MAX_EVALUATIONS)
         try:
-            implied_vol = self.option.impliedVolatility(targetValue=option_price, process=process)
+            implied_vol = self.option.impliedVolatility(option_price, process, *solver_args)
         except RuntimeError:
             # almost all errors are due to the option price being lower than the intrinsic value.
             discount_dvd = base_equity_process.dividend_handle.discount(self._maturity)
@@ -496,13 +739,37 @@ class EquityOption(Instrument):
             fwd_spot_price = spot_price * discount_dvd / discount_risk_free
             option_price = self.intrinsic(date=date, spot_price=fwd_spot_price) + 0.01
             try:
-                implied_vol = self.option.impliedVolatility(targetValue=option_price, process=process)
+                implied_vol = self.option.impliedVolatility(option_price, process, *solver_args)
             except RuntimeError:
                 option_price += 0.01
-                implied_vol = self.option.impliedVolatility(targetValue=option_price, process=process)
+                implied_vol = self.option.impliedVolatility(option_price, process, *solver_args)
 
         self._implied_volatility[date].setValue(implied_vol)
 
+    def _store_implied_volatility(self, date, volatility):
+        """ Store the volatility for date, dropping the least recently used dates beyond IMPLIED_VOLATILITY_CACHE_SIZE.
+
+        The quote already stored for date is updated in place, so the process and pricing engine built on it are
+        reused instead of rebuilt for a new quote.
+
+        :param date: QuantLib.Date
+            The date.
+        :param volatility: float
+            The volatility value.
+        :return: QuantLib.SimpleQuote
+        """
+        try:
+            quote = self._implied_volatility[date]
+        except KeyError:
+            quote = self._implied_volatility[date] = ql.SimpleQuote(volatility)
+        else:
+            quote.setValue(volatility)
+            self._implied_volatility.move_to_end(date)
+        while len(self._implied_volatility) > IMPLIED_VOLATILITY_CACHE_SIZE:
+            old_date, _ = self._implied_volatility.popitem(last=False)
+            self._implied_volatility_prices.pop(old_date, None)
+        return quote
+
     def volatility_update(self, date, base_date, spot_price, option_price, dividend_yield, dividend_tax, volatility,
                           base_equity_process, risk_free_yield_curve_ts, engine_name, get_constants_from_ts=False,
                           **kwargs):
@@ -538,14 +805,14 @@ class EquityOption(Instrument):
         if date > base_date:
             date = base_date
         if volatility is not None:
-            self._implied_volatility[date] = ql.SimpleQuote(volatility)
-            process = base_equity_process.process(volatility=self._implied_volatility[date])
+            self._store_implied_volatility(date=date, volatility=volatility)
+            process = self._volatility_process(date=date, base_equity_process=base_equity_process)
         else:
             process_name = base_equity_process.process_name
             if process_name in [BLACK_SCHOLES, BLACK_SCHOLES_MERTON]:
                 self._black_implied_vol(date=date, option_price=option_price, spot_price=spot_price,
-                                        base_equity_process=base_equity_process, engine_name=engine_name)
-                process = base_equity_process.process(volatility=self._implied_volatility[date])
+                                        base_equity_process=base_equity_process)
+                process = self._volatility_process(date=date, base_equity_process=base_equity_process)
             elif process_name in [HESTON, GJR_GARCH]:
                 if get_constants_from_ts:
                     if process_name == HESTON:
@@ -563,6 +830,21 @@ class EquityOption(Instrument):
         # making sure the pricing engine is updated.
         self.set_pricing_engine(engine_name=engine_name, process=process)
 
+    def _volatility_process(self, date, base_equity_process):
+        """ The Black Scholes process at the option volatility for date.
+
+        All the dates share the process and its volatility quote, set to the volatility of the date, so the process
+        and its pricing engines are built only once.
+
+        :param date: QuantLib.Date
+            The date of the stored implied volatility.
+        :param base_equity_process: py:class:'BaseEquityProcess"
+            The Black Scholes process.
+        :return: QuantLib.StochasticProcess
+        """
+        base_equity_process.volatility.setValue(self._implied_volatility[date].value())
+        return base_equity_process.process(volatility=base_equity_process.volatility)
+
     @conditional_vectorize('date', 'volatility', 'spot_price')
     @option_default_values
     def price(self, date, base_date, spot_price, volatility, dividend_yield, dividend_tax, base_equity_process,
@@ -586,14 +868,9 @@ class EquityOption(Instrument):
         :return: float
             The option price at date.
         """
-        ql.Settings.instance().evaluationDate = date
-        if self.is_expired(date=date):
-            return self.intrinsic(date=self._maturity, spot_price=spot_price)
-        else:
-            self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
-                                   dividend_tax=dividend_tax, volatility=volatility,
-                                   base_equity_process=base_equity_process, **kwargs)
-        return self.option.NPV()
+        return self._greeks(date=date, base_date=base_date, spot_price=spot_price, volatility=volatility,
+                            dividend_yield=dividend_yield, dividend_tax=dividend_tax,
+                            base_equity_process=base_equity_process, greeks=('price',), **kwargs)['price']
 
     @conditional_vectorize('spot_price')
     @option_default_values
@@ -619,11 +896,11 @@ class EquityOption(Instrument):
         :return: float
             The option price based on the date and underlying spot price.
         """
-        ql.Settings.instance().evaluationDate = date
+        self._settings.evaluationDate = date
         if self.is_expired(date=date):
             return self.intrinsic(date=self._maturity, spot_price=spot_price)
         else:
-            if date not in self._implied_volatility.keys():
+            if date not in self._implied_volatility:
                 spot_prices = getattr(underlying_instrument, UNADJUSTED_PRICE)
                 base_spot_price = spot_prices(index=date, last_available=True)
                 self.volatility_update(date=date, base_date=base_date, spot_price=base_spot_price,
@@ -654,27 +931,9 @@ class EquityOption(Instrument):
         :return: float
             The option delta at date.
         """
-        ql.Settings.instance().evaluationDate = date
-        if self.is_expired(date=date):
-            if self.intrinsic(date=date, spot_price=spot_price) > 0:
-                return 1
-            else:
-                return 0
-        else:
-            self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
-                                   dividend_tax=dividend_tax, volatility=volatility,
-                                   base_equity_process=base_equity_process, **kwargs)
-            try:
-                return self.option.delta()
-            except RuntimeError:
-                # in case QuantLib pricing engine doesn't have the delta calculation just calculate it numerically.
-                h = 0.01
-                self.base_equity_process.spot_price.setValue(spot_price + h)
-                price_plus = self.option.NPV()
-                self.base_equity_process.spot_price.setValue(spot_price - h)
-                price_minus = self.option.NPV()
-                self.base_equity_process.spot_price.setValue(spot_price)
-                return (price_plus - price_minus) / (2*h)
+        return self._greeks(date=date, base_date=base_date, spot_price=spot_price, volatility=volatility,
+                            dividend_yield=dividend_yield, dividend_tax=dividend_tax,
+                            base_equity_process=base_equity_process, greeks=('delta',), **kwargs)['delta']
 
     @conditional_vectorize('date', 'spot_price', 'volatility')
     @option_default_values
@@ -700,31 +959,21 @@ class EquityOption(Instrument):
         :return: float
             The option delta based on the date and underlying spot price.
         """
-        ql.Settings.instance().evaluationDate = date
+        self._settings.evaluationDate = date
         if self.is_expired(date=date):
             if self.intrinsic(date=date, spot_price=spot_price) > 0:
                 return 1
             else:
                 return 0
         else:
-            if date not in self._implied_volatility.keys():
+            if date not in self._implied_volatility:
                 spot_prices = getattr(underlying_instrument, UNADJUSTED_PRICE)
                 base_spot_price = spot_prices(index=date, last_available=True)
                 self.volatility_update(date=date, base_date=base_date, spot_price=base_spot_price,
                                        dividend_yield=dividend_yield, dividend_tax=dividend_tax,
                                        volatility=volatility, base_equity_process=base_equity_process, **kwargs)
             self.base_equity_process.spot_price.setValue(spot_price)
-            try:
-                return self.option.delta()
-            except RuntimeError:
-                # in case QuantLib pricing engine doesn't have the delta calculation just calculate it numerically.
-                h = 0.01
-                self.base_equity_process.spot_price.setValue(spot_price + h)
-                price_plus = self.option.NPV()
-                self.base_equity_process.spot_price.setValue(spot_price - h)
-                price_minus = self.option.NPV()
-                self.base_equity_process.spot_price.setValue(spot_price)
-                return (price_plus - price_minus) / (2*h)
+            return self._option_delta(spot_price=spot_price)
 
     @conditional_vectorize('date', 'spot_price', 'volatility')
     @option_default_values
@@ -748,25 +997,9 @@ class EquityOption(Instrument):
         :return: float
             The option gamma at date.
         """
-        ql.Settings.instance().evaluationDate = date
-        if self.is_expired(date=date):
-            return 0
-        else:
-            self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
-                                   dividend_tax=dividend_tax, volatility=volatility,
-                                   base_equity_process=base_equity_process, **kwargs)
-            try:
-                return self.option.gamma()
-            except RuntimeError:
-                # in case QuantLib pricing engine doesn't have the delta calculation just calculate it numerically.
-                h = 0.01
-                self.base_equity_process.spot_price.setValue(spot_price + h)
-                price_plus = self.option.NPV()
-                self.base_equity_process.spot_price.setValue(spot_price - h)
-                price_minus = self.option.NPV()
-                self.base_equity_process.spot_price.setValue(spot_price)
-                price = self.option.NPV()
-                return (price_plus - 2*price - price_minus) / (h*h)
+        return self._greeks(date=date, base_date=base_date, spot_price=spot_price, volatility=volatility,
+                            dividend_yield=dividend_yield, dividend_tax=dividend_tax,
+                            base_equity_process=base_equity_process, greeks=('gamma',), **kwargs)['gamma']
 
     @conditional_vectorize('date', 'spot_price', 'volatility')
     @option_default_values
@@ -790,22 +1023,9 @@ class EquityOption(Instrument):
         :return: float
             The option theta at date.
         """
-        ql.Settings.instance().evaluationDate = date
-        if self.is_expired(date=date):
-            return 0
-        else:
-            self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
-                                   dividend_tax=dividend_tax, volatility=volatility,
-                                   base_equity_process=base_equity_process, **kwargs)
-            try:
-                return self.option.theta()
-            except RuntimeError:
-                price = self.option.NPV()
-                new_date = date + ql.Period(1, ql.Days)
-                ql.Settings.instance().evaluationDate = new_date
-                h = self.day_counter.yearFraction(date, new_date)
-                price_plus = self.option.NPV()
-                return (price_plus - price) / h
+        return self._greeks(date=date, base_date=base_date, spot_price=spot_price, volatility=volatility,
+                            dividend_yield=dividend_yield, dividend_tax=dividend_tax,
+                            base_equity_process=base_equity_process, greeks=('theta',), **kwargs)['theta']
 
     @conditional_vectorize('date', 'spot_price', 'volatility')
     @option_default_values
@@ -829,23 +1049,9 @@ class EquityOption(Instrument):
         :return: float
             The option vega at date.
         """
-        ql.Settings.instance().evaluationDate = date
-        if self.is_expired(date=date):
-            return 0
-        else:
-            self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
-                                   dividend_tax=dividend_tax, volatility=volatility,
-                                   base_equity_process=base_equity_process, **kwargs)
-            try:
-                return self.option.vega()
-            except RuntimeError:
-                volatility = self._implied_volatility[date].value()
-                price = self.option.NPV()
-                h = 0.0001
-                self._implied_volatility[date].setValue(volatility + h)
-                price_plus = self.option.NPV()
-                self._implied_volatility[date].setValue(volatility)
-                return (price_plus - price) / h
+        return self._greeks(date=date, base_date=base_date, spot_price=spot_price, volatility=volatility,
+                            dividend_yield=dividend_yield, dividend_tax=dividend_tax,
+                            base_equity_process=base_equity_process, greeks=('vega',), **kwargs)['vega']
 
     @conditional_vectorize('date', 'spot_price', 'volatility')
     @option_default_values
@@ -868,34 +1074,438 @@ class EquityOption(Instrument):
         :return: float
             The option rho at date.
         """
-        ql.Settings.instance().evaluationDate = date
-        if self.is_expired(date=date):
-            return 0
-        else:
-            self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
-                                   dividend_tax=dividend_tax, volatility=volatility,
-                                   base_equity_process=base_equity_process, **kwargs)
-            try:
-                return self.option.rho()
-            except RuntimeError:
-                price = self.option.NPV()
-                h = 0.0001
-                yield_curve = self.risk_free_yield_curve_ts.yield_curve(date=date)
-                zero_spread_curve = self.risk_free_yield_curve_ts.spreaded_curve(date=date, spread=h,
-                                                                                 compounding=ql.Continuous,
-                                                                                 frequency=ql.NoFrequency)
-                base_equity_process.risk_free_handle.linkTo(zero_spread_curve)
-                price_plus = self.option.NPV()
-                base_equity_process.risk_free_handle.linkTo(yield_curve)
-                return (price_plus - price) / h
+        return self._greeks(date=date, base_date=base_date, spot_price=spot_price, volatility=volatility,
+                            dividend_yield=dividend_yield, dividend_tax=dividend_tax,
+                            base_equity_process=base_equity_process, greeks=('rho',), **kwargs)['rho']
 
-    @conditional_vectorize('date', 'spot_price', 'option_price')
-    @option_default_values
-    def implied_volatility(self, date, base_date, spot_price, dividend_yield, dividend_tax, volatility,
-                           base_equity_process, option_price, **kwargs):
+    def greeks(self, date, greeks=GREEKS, **kwargs):
+        """ The option price and greeks, updating the volatility and pricing engine only once per date.
+
+        :param date: date-like, list-like
+            The date(s).
+        :param greeks: iterable of str
+            The values to be calculated, any of 'price', 'delta', 'gamma', 'theta', 'vega' and 'rho'.
+        :param kwargs:
+            Overrides accepted by :py:meth:`price`, like base_date, spot_price or volatility. spot_price and
+            volatility may also be lists, broadcast against the dates.
+        :return: dict
+            The values by name in `greeks`, as floats if `date`, spot_price and volatility are single values or
+            numpy.ndarray otherwise.
+        """
+        grid = [name for name in ('spot_price', 'volatility') if isvectorizable(kwargs.get(name))]
+        columns = np.broadcast_arrays(np.atleast_1d(to_ql_date_serials(date)),
+                                      *(np.asarray(kwargs[name], dtype=np.float64) for name in grid))
+        # Each distinct date, spot price and volatility is calculated only once.
+        grid_rows, positions = np.unique(np.column_stack(columns).astype(np.float64), axis=0, return_inverse=True)
+        serials = grid_rows[:, 0].astype(np.int64)
+        values = {greek: np.empty(len(grid_rows)) for greek in greeks}
+        ts_values = self._ts_values_bulk(serials=serials, **kwargs)
+        # The NumPy pricing kernels calculate the values of all the dates together after the loop.
+        kernel_inputs = list() if len(grid_rows) > 1 else None
+        kernel_rows = list()
+        for i, row in enumerate(grid_rows.tolist()):
+            kernel_count = len(kernel_inputs) if kernel_inputs is not None else 0
+            kwargs.update((name, float(value[i])) for name, value in ts_values.items())
+            kwargs.update(zip(grid, row[1:]))
+            date_values = self._greeks_at_date(date=ql.Date(int(row[0])), greeks=greeks,
+                                               kernel_inputs=kernel_inputs, **kwargs)
+            if kernel_inputs is not None and len(kernel_inputs) > kernel_count:
+                kernel_rows.append(i)
+            for greek in greeks:
+                if greek in date_values:
+                    values[greek][i] = date_values[greek]
+        for (kernel, _), (rows, inputs) in _kernel_batches(kernel_rows, kernel_inputs or ()).items():
+            kernel_values = _kernel_values(kernel, inputs)
+            for greek in greeks:
+                if greek in kernel_values:
+                    values[greek][rows] = kernel_values[greek]
+        if isvectorizable(date) or grid:
+            positions = positions.ravel()
+            return {greek: value[positions] for greek, value in values.items()}
+        return {greek: float(value[0]) for greek, value in values.items()}
+
+    def price_many(self, dates, n_workers=None, **kwargs):
+        """ The option prices at many dates, with the dates split across worker processes.
+
+        QuantLib's evaluation date is global to a process, so dates can only be priced in parallel by separate
+        processes, each with its own QuantLib settings. The workers are forked from the current process and inherit
+        the option as it is set up, with its underlying, yield curve, process and the overrides in `kwargs`, so only
+        the dates and the prices are sent between processes. Where processes can't be forked the dates are priced in
+        the current process.
+
+        :param dates: list-like of date-like
+            The dates.
+        :param n_workers: int, optional
+            The number of worker processes, the number of CPUs by default.
+        :param kwargs:
+            Overrides accepted by :py:meth:`price`, like base_date or engine_name, applied to all the dates.
+        :return: numpy.ndarray
+            The option prices, in the order of `dates`.
         """
+        dates = (np.atleast_1d(to_ql_date_serials(dates)) - EPOCH_SERIAL_NUMBER).astype('datetime64[D]')
+        n_workers = min(n_workers or os.cpu_count() or 1, len(dates))
+        if n_workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            return self.greeks(date=dates, greeks=('price',), **kwargs)['price']
+        chunks = np.array_split(dates, n_workers)
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_set_worker_option, initargs=(self, kwargs)) as executor:
+            prices = list(executor.map(_worker_prices, chunks))
+        return np.concatenate(prices)
+
+    @staticmethod
+    def price_chain(options, date, **kwargs):
+        """ The prices of several options at the same date, like a strike chain.
+
+        The options using a NumPy pricing kernel (see :py:meth:`_pricing_kernel`) are priced together, one row per
+        option, each with its own strike and implied volatility. The other options are priced by their own pricing
+        engines.
+
+        :param options: list of :py:class:`EquityOption`
+            The options.
         :param date: date-like
             The date.
+        :param kwargs:
+            Overrides accepted by :py:meth:`price`, like base_date or engine_name, applied to all the options.
+        :return: numpy.ndarray
+            The option prices, in the order of `options`.
+        """
+        date = to_ql_date(date)
+        prices = np.empty(len(options))
+        kernel_inputs = list()
+        kernel_rows = list()
+        for i, option in enumerate(options):
+            kernel_count = len(kernel_inputs)
+            option_values = option._greeks_at_date(date=date, greeks=('price',), kernel_inputs=kernel_inputs,
+                                                   **kwargs)
+            if len(kernel_inputs) > kernel_count:
+                kernel_rows.append(i)
+            else:
+                prices[i] = option_values['price']
+        for (kernel, _), (rows, inputs) in _kernel_batches(kernel_rows, kernel_inputs).items():
+            prices[rows] = _kernel_values(kernel, inputs)['price']
+        return prices
+
+    @option_default_values
+    def _greeks_at_date(self, **kwargs):
+
+        return self._greeks(**kwargs)
+
+    def _greeks(self, date, base_date, spot_price, volatility, dividend_yield, dividend_tax, base_equity_process,
+                greeks, kernel_inputs=None, **kwargs):
+        """ The option price and greeks at date, reusing the same volatility and pricing engine for all of them.
+
+        :param date: QuantLib.Date
+            The date.
+        :param base_date: QuantLib.Date
+            When date is a future date base_date is the last date on the "present" used to estimate future values.
+        :param spot_price: float
+            Underlying price override value to calculate the option.
+        :param volatility: float
+            Volatility override value to calculate the option.
+        :param dividend_yield: float
+            The dividend yield of the underlying instrument
+        :param dividend_tax: float
+            The dividend % tax applied.
+        :param base_equity_process: py:class:'BaseEquityProcess"
+            The Stochastic process used for calculations.
+        :param greeks: iterable of str
+            The values to be calculated, any of 'price', 'delta', 'gamma', 'theta', 'vega' and 'rho'.
+        :param kernel_inputs: list, optional
+            When given and a NumPy pricing kernel is used, the kernel name and inputs are appended to it and the
+            kernel values are left out of the result, to be calculated later together with other dates or options.
+        :return: dict
+            The values by name in `greeks`.
+        """
+        self._settings.evaluationDate = date
+        values = dict()
+        if self.is_expired(date=date):
+            for greek in greeks:
+                if greek == 'price':
+                    values[greek] = self.intrinsic(date=self._maturity, spot_price=spot_price)
+                elif greek == 'delta':
+                    values[greek] = 1 if self.intrinsic(date=date, spot_price=spot_price) > 0 else 0
+                else:
+                    values[greek] = 0
+            return values
+        self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
+                               dividend_tax=dividend_tax, volatility=volatility,
+                               base_equity_process=base_equity_process, **kwargs)
+        kernel = self._pricing_kernel(base_equity_process=base_equity_process, greeks=greeks,
+                                      batched=kernel_inputs is not None, **kwargs)
+        vol_date = base_date if date > base_date else date
+        stored_values = None
+        # Only the analytic European engine prices from the curves' discounts to maturity alone, the numerical
+        # engines depend on the whole term structures.
+        if kernel_inputs is None and self._engine_type is ql.AnalyticEuropeanEngine:
+            stored_values = self._stored_greek_values(date=date, base_equity_process=base_equity_process,
+                                                      volatility=self._implied_volatility[vol_date].value())
+            values.update((greek, stored_values[greek]) for greek in greeks if greek in stored_values)
+            if len(values) == len(greeks):
+                return values
+        kernel_greeks = ()
+        if kernel is not None:
+            inputs = self._kernel_inputs(kernel=kernel, date=date, base_equity_process=base_equity_process,
+                                         volatility=self._implied_volatility[vol_date].value())
+            if kernel_inputs is None:
+                values.update(_kernel_values(kernel, inputs))
+            else:
+                kernel_inputs.append((kernel, inputs))
+                kernel_greeks = KERNEL_GREEKS[kernel]
+        # The engine is bound once for the date: analytic engines calculate every Greek in the same calculation,
+        # and the numerical Greeks share the option prices they need.
+        prices = dict()
+        for greek in greeks:
+            if greek in values or greek in kernel_greeks:
+                continue
+            elif greek == 'price':
+                values[greek] = self._option_price(prices=prices)
+            elif greek == 'delta':
+                values[greek] = self._option_delta(spot_price=spot_price, prices=prices)
+            elif greek == 'gamma':
+                values[greek] = self._option_gamma(spot_price=spot_price, prices=prices)
+            elif greek == 'theta':
+                values[greek] = self._option_theta(date=date, prices=prices)
+            elif greek == 'vega':
+                values[greek] = self._option_vega(base_equity_process=base_equity_process, prices=prices)
+            elif greek == 'rho':
+                values[greek] = self._option_rho(date=date, base_equity_process=base_equity_process,
+                                                 prices=prices)
+            else:
+                raise ValueError('Greek not supported: {}'.format(greek))
+        if stored_values is not None:
+            stored_values.update(values)
+        return values
+
+    def _stored_greek_values(self, date, base_equity_process, volatility):
+        """ The prices and Greeks already calculated at the same market state, updated in place with new ones.
+
+        Only for the analytic European engine, whose values depend on the curves through the discounts to maturity
+        and the year fractions to it alone. The market state is read from the process after it is updated to the
+        date, so it covers every override and timeseries value, and the volatility is the one the option is priced
+        at.
+
+        :param date: QuantLib.Date
+            The date.
+        :param base_equity_process: py:class:'BaseEquityProcess"
+            The Black Scholes process, already updated to the date.
+        :param volatility: float
+            The option volatility.
+        :return: dict
+            The values by Greek name.
+        """
+        risk_free_handle = base_equity_process.risk_free_handle
+        key = (date.serialNumber(), base_equity_process.process_name, base_equity_process.spot_price.value(),
+               base_equity_process.dividend_yield.value(), risk_free_handle.discount(self._maturity),
+               risk_free_handle.referenceDate().serialNumber(), risk_free_handle.dayCounter().name(), volatility)
+        try:
+            stored_values = self._greek_values[key]
+        except KeyError:
+            stored_values = self._greek_values[key] = dict()
+            while len(self._greek_values) > GREEKS_CACHE_SIZE:
+                self._greek_values.popitem(last=False)
+            return stored_values
+        self._greek_values.move_to_end(key)
+        return stored_values
+
+    def _pricing_kernel(self, base_equity_process, greeks, batched, engine_name=None, **kwargs):
+        """ The NumPy pricing kernel replacing the QuantLib engine, if any.
+
+        American options under the 'BINOMIAL_VANILLA' engine use the Leisen-Reimer tree when
+        `binomial_tree_kernel` is set. European options under the engines that price them analytically use the Black
+        Scholes formula when priced together with other dates or options, as QuantLib is faster for a single one.
+
+        :param base_equity_process: py:class:'BaseEquityProcess"
+            The Stochastic process used for calculations.
+        :param greeks: iterable of str
+            The values to be calculated.
+        :param batched: bool
+            Whether the kernel values are calculated together with other dates or options.
+        :param engine_name: str, optional
+            The QuantLib pricing engine name.
+        :return: str, None
+            The kernel name, a key of KERNEL_GREEKS.
+        """
+        if base_equity_process.process_name not in [BLACK_SCHOLES, BLACK_SCHOLES_MERTON]:
+            return None
+        engine_name = str(engine_name if engine_name is not None else self.engine_name).upper()
+        if self.exercise_type == 'AMERICAN':
+            kernel = BINOMIAL_TREE if self.binomial_tree_kernel and engine_name == 'BINOMIAL_VANILLA' else None
+        elif self.exercise_type == 'EUROPEAN':
+            analytic = engine_name in ['ANALYTIC_EUROPEAN', 'BINOMIAL_VANILLA', 'FINITE_DIFFERENCES']
+            kernel = BLACK_SCHOLES_FORMULA if batched and analytic else None
+        else:
+            kernel = None
+        if kernel is None or not set(KERNEL_GREEKS[kernel]).intersection(greeks):
+            return None
+        return kernel
+
+    def _kernel_inputs(self, kernel, date, base_equity_process, volatility):
+        """ Market inputs of a NumPy pricing kernel, the same constant coefficients the QuantLib engines take from
+        the process.
+
+        :param kernel: str
+            The kernel name, a key of KERNEL_GREEKS.
+        :param date: QuantLib.Date
+            The date.
+        :param base_equity_process: py:class:'BaseEquityProcess"
+            The Stochastic process used for calculations, already updated to the date.
+        :param volatility: float
+            The option volatility.
+        :return: dict
+            Keyword arguments for the kernel.
+        """
+        risk_free_handle = base_equity_process.risk_free_handle
+        risk_free_day_counter = risk_free_handle.dayCounter()
+        time = risk_free_day_counter.yearFraction(risk_free_handle.referenceDate(), self._maturity)
+        spot_price = base_equity_process.spot_price.value()
+        if kernel == BLACK_SCHOLES_FORMULA:
+            if base_equity_process.process_name == BLACK_SCHOLES:
+                dividend_discount = 1
+            else:
+                dividend_discount = base_equity_process.dividend_handle.discount(self._maturity)
+            # The same time QuantLib's BlackConstantVol, with no settlement days, gives to the maturity.
+            reference_date = base_equity_process.calendar.advance(date, 0, ql.Days)
+            volatility_time = base_equity_process.day_counter.yearFraction(reference_date, self._maturity)
+            return dict(spot_price=spot_price, strike=self.strike,
+                        discount=risk_free_handle.discount(self._maturity), dividend_discount=dividend_discount,
+                        volatility=volatility, volatility_time=volatility_time, rate_time=time,
+                        is_call=self._is_call)
+        risk_free_rate = risk_free_handle.zeroRate(self._maturity, risk_free_day_counter, ql.Continuous,
+                                                   ql.NoFrequency).rate()
+        if base_equity_process.process_name == BLACK_SCHOLES:
+            dividend_yield = 0
+        else:
+            dividend_handle = base_equity_process.dividend_handle
+            dividend_yield = dividend_handle.zeroRate(self._maturity, dividend_handle.dayCounter(), ql.Continuous,
+                                                      ql.NoFrequency).rate()
+        return dict(spot_price=spot_price, strike=self.strike, risk_free_rate=risk_free_rate,
+                    dividend_yield=dividend_yield, volatility=volatility, time=time, is_call=self._is_call,
+                    steps=self.binomial_time_steps)
+
+    def _engine_greek(self, greek):
+        """ The Greek from the QuantLib pricing engine, or None when the engine doesn't calculate it.
+
+        :param greek: str
+            The Greek name, any of 'delta', 'gamma', 'theta', 'vega' and 'rho'.
+        :return: float, None
+        """
+        missing_greeks = self._missing_greeks.setdefault(self._engine_type, set())
+        if greek in missing_greeks:
+            return None
+        try:
+            return getattr(self.option, greek)()
+        except RuntimeError:
+            missing_greeks.add(greek)
+            return None
+
+    def _option_price(self, prices=None):
+        """ The option NPV.
+
+        :param prices: dict, optional
+            Prices already calculated at the same date, shared by the numerical Greeks so each price is only
+            calculated once.
+        :return: float
+        """
+        if prices is None:
+            return self.option.NPV()
+        if 'price' not in prices:
+            prices['price'] = self.option.NPV()
+        return prices['price']
+
+    def _spot_bumped_prices(self, spot_price, h, prices=None):
+        """ The option NPV with the underlying spot price bumped up and down by h.
+
+        :param spot_price: float
+            The underlying spot price.
+        :param h: float
+            The spot price bump.
+        :param prices: dict, optional
+            Prices already calculated at the same date, shared by the numerical Greeks.
+        :return: tuple of float
+        """
+        key = ('spot_price', h)
+        if prices is not None and key in prices:
+            return prices[key]
+        self.base_equity_process.spot_price.setValue(spot_price + h)
+        price_plus = self.option.NPV()
+        self.base_equity_process.spot_price.setValue(spot_price - h)
+        price_minus = self.option.NPV()
+        self.base_equity_process.spot_price.setValue(spot_price)
+        if prices is not None:
+            prices[key] = price_plus, price_minus
+        return price_plus, price_minus
+
+    def _option_delta(self, spot_price, prices=None):
+
+        delta = self._engine_greek('delta')
+        if delta is not None:
+            return delta
+        # in case QuantLib pricing engine doesn't have the delta calculation just calculate it numerically.
+        h = 0.01
+        price_plus, price_minus = self._spot_bumped_prices(spot_price=spot_price, h=h, prices=prices)
+        return (price_plus - price_minus) / (2*h)
+
+    def _option_gamma(self, spot_price, prices=None):
+
+        gamma = self._engine_greek('gamma')
+        if gamma is not None:
+            return gamma
+        # in case QuantLib pricing engine doesn't have the gamma calculation just calculate it numerically.
+        h = 0.01
+        price_plus, price_minus = self._spot_bumped_prices(spot_price=spot_price, h=h, prices=prices)
+        price = self._option_price(prices=prices)
+        return (price_plus - 2*price - price_minus) / (h*h)
+
+    def _option_theta(self, date, prices=None):
+
+        theta = self._engine_greek('theta')
+        if theta is not None:
+            return theta
+        price = self._option_price(prices=prices)
+        new_date = date + ql.Period(1, ql.Days)
+        self._settings.evaluationDate = new_date
+        h = self.day_counter.yearFraction(date, new_date)
+        price_plus = self.option.NPV()
+        self._settings.evaluationDate = date
+        return (price_plus - price) / h
+
+    def _option_vega(self, base_equity_process, prices=None):
+
+        vega = self._engine_greek('vega')
+        if vega is not None:
+            return vega
+        volatility = base_equity_process.volatility.value()
+        price = self._option_price(prices=prices)
+        h = 0.0001
+        base_equity_process.volatility.setValue(volatility + h)
+        price_plus = self.option.NPV()
+        base_equity_process.volatility.setValue(volatility)
+        return (price_plus - price) / h
+
+    def _option_rho(self, date, base_equity_process, prices=None):
+
+        rho = self._engine_greek('rho')
+        if rho is not None:
+            return rho
+        price = self._option_price(prices=prices)
+        h = 0.0001
+        yield_curve = self.risk_free_yield_curve_ts.yield_curve(date=date)
+        zero_spread_curve = self.risk_free_yield_curve_ts.spreaded_curve(date=date, spread=h,
+                                                                         compounding=ql.Continuous,
+                                                                         frequency=ql.NoFrequency)
+        base_equity_process.risk_free_handle.linkTo(zero_spread_curve)
+        price_plus = self.option.NPV()
+        base_equity_process.risk_free_handle.linkTo(yield_curve)
+        return (price_plus - price) / h
+
+    def implied_volatility(self, date, **kwargs):
+        """ The option implied volatility from its price.
+
+        When only `date` is list-like, European options under a Black Scholes process are solved for all the dates
+        together with the NumPy Black implied volatility solver, see :py:meth:`implied_volatility_chain`.
+
+        :param date: date-like, list-like
+            The date(s).
         :param base_date: date-like
             When date is a future date base_date is the last date on the "present" used to estimate future values.
         :param spot_price: float
@@ -910,14 +1520,132 @@ class EquityOption(Instrument):
             The Stochastic process used for calculations.
         :param option_price: float
             The option price to be used for implied vol calculation
-        :return: float
+        :return: float, numpy.ndarray
             The option volatility based on the option price and date.
         """
-        ql.Settings.instance().evaluationDate = date
+        if not isvectorizable(date) or isvectorizable(kwargs.get('spot_price')) \
+                or isvectorizable(kwargs.get('option_price')):
+            return self._implied_volatility_at_date(date=date, **kwargs)
+        serials = np.atleast_1d(to_ql_date_serials(date))
+        if len(serials) == 0:
+            return np.nan
+        ts_values = self._ts_values_bulk(serials=serials, **kwargs)
+        requests = list()
+        for i, serial in enumerate(serials.tolist()):
+            date_kwargs = dict(kwargs, date=ql.Date(serial))
+            date_kwargs.update((name, float(value[i])) for name, value in ts_values.items())
+            requests.append((self, date_kwargs))
+        return ExtendedArray(self._implied_volatilities(requests), meta=dict(kwargs, date=date))
+
+    @conditional_vectorize('date', 'spot_price', 'option_price')
+    @option_default_values
+    def _implied_volatility_at_date(self, date, base_date, spot_price, dividend_yield, dividend_tax, volatility,
+                                    base_equity_process, option_price, **kwargs):
+
+        self._settings.evaluationDate = date
         self.volatility_update(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
                                dividend_tax=dividend_tax, volatility=volatility,
                                base_equity_process=base_equity_process, option_price=option_price, **kwargs)
-        return self._implied_volatility[date].value()
+        # Future dates use the volatility stored at base_date.
+        return self._implied_volatility[base_date if date > base_date else date].value()
+
+    @staticmethod
+    def implied_volatility_chain(options, date, **kwargs):
+        """ The implied volatilities of several options at the same date, like a strike chain.
+
+        European options under a Black Scholes process are solved together with the NumPy Black implied volatility
+        solver, the others one by one as in :py:meth:`implied_volatility`. The volatilities are stored in each
+        option, so its prices and Greeks at the date reuse them.
+
+        :param options: list of :py:class:`EquityOption`
+            The options.
+        :param date: date-like
+            The date.
+        :param kwargs:
+            Overrides accepted by :py:meth:`implied_volatility`, like base_date or engine_name, applied to all the
+            options.
+        :return: numpy.ndarray
+            The option volatilities, in the order of `options`.
+        """
+        date = to_ql_date(date)
+        return EquityOption._implied_volatilities([(option, dict(kwargs, date=date)) for option in options])
+
+    @staticmethod
+    def _implied_volatilities(requests):
+        """ Implied volatilities of pairs of option and keyword arguments of :py:meth:`implied_volatility`, solving
+        the European ones under a Black Scholes process together.
+
+        :param requests: list of tuple
+            The options and their arguments, each with a single date.
+        :return: numpy.ndarray
+            The option volatilities, in the order of `requests`.
+        """
+        volatilities = np.empty(len(requests))
+        black_inputs = list()
+        black_rows = list()
+        # Requests sharing the volatility date and price of an option, like the dates after base_date, reuse the
+        # volatility of the first one, as they would find it already stored.
+        first_rows = dict()
+        repeated_rows = list()
+        for i, (option, kwargs) in enumerate(requests):
+            inputs = option._black_implied_volatility_inputs(**kwargs)
+            if inputs is None:
+                volatilities[i] = option._implied_volatility_at_date(**kwargs)
+                continue
+            vol_date, option_price, _ = inputs
+            key = (id(option), vol_date.serialNumber(), option_price)
+            if key in first_rows:
+                repeated_rows.append((i, first_rows[key]))
+                continue
+            first_rows[key] = i
+            black_inputs.append(inputs)
+            black_rows.append(i)
+        if black_rows:
+            black_volatilities = black_implied_volatility(accuracy=EUROPEAN_IMPLIED_VOLATILITY_ACCURACY,
+                                                          max_iterations=EUROPEAN_IMPLIED_VOLATILITY_MAX_EVALUATIONS,
+                                                          **_stack([inputs for _, _, inputs in black_inputs]))
+            for i, (vol_date, option_price, _), volatility in zip(black_rows, black_inputs, black_volatilities):
+                option, kwargs = requests[i]
+                if np.isnan(volatility):
+                    # Prices out of the volatility bounds go through QuantLib and its intrinsic value adjustments.
+                    volatilities[i] = option._implied_volatility_at_date(**kwargs)
+                else:
+                    option._store_implied_volatility(date=vol_date, volatility=volatility)
+                    option._implied_volatility_prices[vol_date] = option_price
+                    volatilities[i] = volatility
+        for i, first_row in repeated_rows:
+            volatilities[i] = volatilities[first_row]
+        return volatilities
+
+    @option_default_values
+    def _black_implied_volatility_inputs(self, date, base_date, spot_price, dividend_yield, dividend_tax, volatility,
+                                         base_equity_process, risk_free_yield_curve_ts, option_price, **kwargs):
+        """ The arguments of :py:func:`black_implied_volatility` at date.
+
+        :return: tuple, None
+            The date the volatility is stored at, the option price and the solver arguments, or None when the option
+            volatility must be found by :py:meth:`implied_volatility`.
+        """
+        vol_date = base_date if date > base_date else date
+        if volatility is not None or self.exercise_type != 'EUROPEAN' or self.is_expired(date=date) \
+                or base_equity_process.process_name not in [BLACK_SCHOLES, BLACK_SCHOLES_MERTON] \
+                or (vol_date in self._implied_volatility
+                    and option_price == self._implied_volatility_prices.get(vol_date)):
+            return None
+        self._settings.evaluationDate = date
+        self._process_values_update(base_equity_process=base_equity_process, date=date, base_date=base_date,
+                                    spot_price=spot_price, dividend_yield=dividend_yield, dividend_tax=dividend_tax,
+                                    risk_free_yield_curve_ts=risk_free_yield_curve_ts)
+        discount = base_equity_process.risk_free_handle.discount(self._maturity)
+        if base_equity_process.process_name == BLACK_SCHOLES:
+            dividend_discount = 1
+        else:
+            dividend_discount = base_equity_process.dividend_handle.discount(self._maturity)
+        # The same time QuantLib's BlackConstantVol, with no settlement days, gives to the maturity.
+        reference_date = base_equity_process.calendar.advance(date, 0, ql.Days)
+        time = base_equity_process.day_counter.yearFraction(reference_date, self._maturity)
+        return vol_date, option_price, dict(price=option_price, forward=spot_price * dividend_discount / discount,
+                                            strike=self.strike, discount=discount, time=time, is_call=self._is_call)
 
     @conditional_vectorize('date', 'spot_price', 'volatility')
     @option_default_values
@@ -941,7 +1669,7 @@ class EquityOption(Instrument):
         :return: float
             The option optionality at date.
         """
-        ql.Settings.instance().evaluationDate = date
+        self._settings.evaluationDate = date
         if self.is_expired(date=date):
             return 0
         else:
@@ -969,10 +1697,7 @@ class EquityOption(Instrument):
         spot_prices = getattr(underlying_instrument, UNADJUSTED_PRICE)
         return spot_prices(index=date, last_available=True)
 
-    @conditional_vectorize('date', 'spot_price', 'volatility')
-    @option_default_values
-    def delta_value(self, date, base_date, spot_price, dividend_yield, dividend_tax, volatility, base_equity_process,
-                    **kwargs):
+    def delta_value(self, date, **kwargs):
         """ Return the option delta notional value
 
         :param date: date-like
@@ -992,6 +1717,34 @@ class EquityOption(Instrument):
         :return: float
             The option delta notional value.
         """
+        return self._delta_notional(date=date, **kwargs)
+
+    def _delta_notional(self, date, **kwargs):
+        """ The option delta notional value, with the deltas of all the dates, spot prices and volatilities
+        calculated together by :py:meth:`greeks` when any of them is a list.
+
+        :return: float, numpy.ndarray
+            The option delta notional value.
+        """
+        grid = [kwargs.get(name) for name in ('spot_price', 'volatility')]
+        if not any(isvectorizable(arg) for arg in [date] + grid) or kwargs.get('underlying_instrument') is not None:
+            return self._delta_notional_at_date(date=date, **kwargs)
+        if any(isvectorizable(arg) and len(arg) == 0 for arg in [date] + grid):
+            return np.nan
+        spot_price = kwargs.get('spot_price')
+        if spot_price is None:
+            serials = np.atleast_1d(to_ql_date_serials(date))
+            spot_price = self._ts_values_bulk(serials=serials, **dict(kwargs, option_price=0, dividend_yield=0))[
+                'spot_price']
+        delta = self.greeks(date=date, greeks=('delta',), **kwargs)['delta']
+        return ExtendedArray(np.asarray(delta) * np.asarray(spot_price, dtype=np.float64) * self.contract_size,
+                             meta=dict(kwargs, date=date))
+
+    @conditional_vectorize('date', 'spot_price', 'volatility')
+    @option_default_values
+    def _delta_notional_at_date(self, date, base_date, spot_price, dividend_yield, dividend_tax, volatility,
+                                base_equity_process, **kwargs):
+
         delta = self.delta(date=date, base_date=base_date, spot_price=spot_price, dividend_yield=dividend_yield,
                            dividend_tax=dividend_tax, volatility=volatility,
                            base_equity_process=base_equity_process, bypass_option_default_values=True, **kwargs)
@@ -0,0 +1,164 @@
+# Copyright (C) 2016-2018 Lanx Capital Investimentos LTDA.
+#
+# This file is part of Time Series Finance (tsfin).
+#
+# Time Series Finance (tsfin) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# Time Series Finance (tsfin) is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Time Series Finance (tsfin). If not, see <https://www.gnu.org/licenses/>.
+"""
+OptionChain class, to price many equity options together from arrays of their terms.
+"""
+import QuantLib as ql
+import numpy as np
+from tsfin.base import to_ql_date
+from tsfin.instruments.equities.equityoption import EquityOption
+from tsfin.instruments.equities._black import black_scholes_greeks
+
+
+class OptionChain:
+    """ Equity options stored as arrays of their strikes, maturities and types, like a strike chain.
+
+    :param options: list of :py:class:`EquityOption`
+        The options.
+    """
+
+    def __init__(self, options):
+        self.options = list(options)
+        self.strikes = np.array([option.strike for option in self.options], dtype=np.float64)
+        self.contract_sizes = np.array([option.contract_size for option in self.options], dtype=np.float64)
+        option_types = [str(option.option_type).upper() for option in self.options]
+        self.is_call = np.array([option_type == 'CALL' for option_type in option_types], dtype=bool)
+        # Sign of the payoffs, zero for option types without an intrinsic value, so intrinsic values need no branches.
+        self.signs = np.array([1.0 if option_type == 'CALL' else -1.0 if option_type == 'PUT' else 0.0
+                               for option_type in option_types])
+        self.maturities = np.array([option.maturity(date=None).serialNumber() for option in self.options],
+                                   dtype=np.int64)
+        # Year fractions are calculated once per day counter and maturity, chains have only a few of each.
+        day_counters = dict()
+        time_keys = dict()
+        time_index = list()
+        for option, maturity in zip(self.options, self.maturities.tolist()):
+            name = option.day_counter.name()
+            day_counters.setdefault(name, option.day_counter)
+            time_index.append(time_keys.setdefault((name, maturity), len(time_keys)))
+        self._day_counters = day_counters
+        self._time_keys = list(time_keys)
+        self._time_index = np.array(time_index, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.options)
+
+    def times(self, date):
+        """ The time to maturity of the options, in years.
+
+        :param date: date-like
+            The date.
+        :return: numpy.ndarray
+        """
+        date = to_ql_date(date)
+        times = np.array([self._day_counters[name].yearFraction(date, ql.Date(maturity))
+                          for name, maturity in self._time_keys], dtype=np.float64)
+        return times[self._time_index]
+
+    def price_all(self, date, spot_price, risk_free_rate, dividend_yield, volatility):
+        """ Black Scholes Merton prices of all the options at once, for chains of European options.
+
+        :param date: date-like
+            The date.
+        :param spot_price: float, array-like
+            The underlying spot price(s).
+        :param risk_free_rate: float, array-like
+            The continuously compounded risk free rate(s) to the option maturities.
+        :param dividend_yield: float, array-like
+            The continuously compounded dividend yield(s) to the option maturities.
+        :param volatility: float, array-like
+            The Black volatilities of the options.
+        :return: numpy.ndarray
+            The option prices, in the order of `options`. Options at maturity are worth their intrinsic value and
+            expired options zero.
+        :raises ValueError:
+            If any option doesn't have European exercise, :py:meth:`price` prices those with their own engines.
+        """
+        return self.greeks_all(date=date, spot_price=spot_price, risk_free_rate=risk_free_rate,
+                               dividend_yield=dividend_yield, volatility=volatility)['price']
+
+    def greeks_all(self, date, spot_price, risk_free_rate, dividend_yield, volatility):
+        """ Black Scholes Merton prices and Greeks of all the options at once, for chains of European options.
+
+        :param date: date-like
+            The date.
+        :param spot_price: float, array-like
+            The underlying spot price(s).
+        :param risk_free_rate: float, array-like
+            The continuously compounded risk free rate(s) to the option maturities.
+        :param dividend_yield: float, array-like
+            The continuously compounded dividend yield(s) to the option maturities.
+        :param volatility: float, array-like
+            The Black volatilities of the options.
+        :return: dict
+            numpy.ndarray of the 'price', 'delta', 'gamma', 'theta', 'vega' and 'rho' of the options, by name. The
+            Greeks of options at or after maturity are zero.
+        :raises ValueError:
+            If any option doesn't have European exercise, :py:meth:`price` prices those with their own engines.
+        """
+        # The exercise type is checked here as EquityOption.change_exercise_type may change it after __init__.
+        not_european = [option.ts_name for option in self.options if option.exercise_type != 'EUROPEAN']
+        if not_european:
+            raise ValueError("OptionChain closed form prices and Greeks need European options, got: {}".format(
+                ', '.join(not_european)))
+        times = self.times(date)
+        alive = times > 0
+        spot_price, risk_free_rate, dividend_yield, volatility = (
+            np.broadcast_to(np.asarray(arg, dtype=np.float64), times.shape)
+            for arg in (spot_price, risk_free_rate, dividend_yield, volatility))
+        alive_times = np.where(alive, times, 1.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = black_scholes_greeks(spot_price=spot_price, strike=self.strikes,
+                                          discount=np.exp(-risk_free_rate * alive_times),
+                                          dividend_discount=np.exp(-dividend_yield * alive_times),
+                                          volatility=volatility, volatility_time=alive_times,
+                                          rate_time=alive_times, is_call=self.is_call)
+        values = dict(zip(('price', 'delta', 'gamma', 'theta', 'vega', 'rho'), values))
+        intrinsic = np.where(times == 0, self.intrinsic(spot_price=spot_price), 0.0)
+        values['price'] = np.where(alive, values['price'], intrinsic)
+        for greek in ('delta', 'gamma', 'theta', 'vega', 'rho'):
+            values[greek] = np.where(alive, values[greek], 0.0)
+        return values
+
+    def intrinsic(self, spot_price):
+        """ The intrinsic values of the options.
+
+        :param spot_price: float, array-like
+            The underlying spot price(s).
+        :return: numpy.ndarray
+        """
+        return np.maximum(0.0, self.signs * (np.asarray(spot_price, dtype=np.float64) - self.strikes))
+
+    def price(self, date, **kwargs):
+        """ The prices of the options with their own pricing engines and market data, see
+        :py:meth:`EquityOption.price_chain`.
+
+        :param date: date-like
+            The date.
+        :return: numpy.ndarray
+        """
+        return EquityOption.price_chain(self.options, date=date, **kwargs)
+
+    def implied_volatility(self, date, **kwargs):
+        """ The implied volatilities of the options from their prices, see
+        :py:meth:`EquityOption.implied_volatility_chain`.
+
+        :param date: date-like
+            The date.
+        :return: numpy.ndarray
+        """
+        return EquityOption.implied_volatility_chain(self.options, date=date, **kwargs)
@@ -19,6 +19,7 @@ FraDDI class used to model DDI FRA contracts traded at the B3 Exchange (Brazil).
 
 TODO: Propose implementation of this class in QuantLib.
 """
+import math
 from functools import wraps
 import numpy as np
 import QuantLib as ql
@@ -196,9 +197,9 @@ class FraDDI(Instrument):
             return None
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
         first_cc_rate = self.first_cc.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
-        if np.isnan(first_cc_rate):
+        if math.isnan(first_cc_rate):
             return None
         date = to_ql_date(date)
         reference_date = self.reference_date(date)
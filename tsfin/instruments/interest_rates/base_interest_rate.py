@@ -17,6 +17,7 @@
 """
 Base class for interest rates classes
 """
+import math
 import numpy as np
 import QuantLib as ql
 from tsfin.constants import TENOR_PERIOD, COMPOUNDING, FREQUENCY, ISSUE_DATE, INDEX_TENOR, CURRENCY
@@ -193,7 +194,7 @@ class BaseInterestRate(Instrument):
         sigma_value = sigma.get_values(index=date, last_available=last_available, fill_value=np.nan)
         mean_value = mean.get_values(index=date, last_available=last_available, fill_value=np.nan)
 
-        if np.isnan(sigma_value) or np.isnan(mean_value):
+        if math.isnan(sigma_value) or math.isnan(mean_value):
             convexity_bias = 0
         else:
             convexity_bias = self._convexity(future_price=future_price, date=date, sigma=sigma_value, mean=mean_value)
@@ -337,7 +338,7 @@ class BaseInterestRate(Instrument):
         if self.is_expired(date, **other_args):
             return None
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         return None
 
@@ -360,6 +361,6 @@ class BaseInterestRate(Instrument):
         if self.is_expired(date):
             return None
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         return ql.InterestRate(rate, self.day_counter, self.compounding, self.frequency)
@@ -17,6 +17,7 @@
 """
 A class for modelling interest rate swaps.
 """
+import math
 import numpy as np
 import QuantLib as ql
 from functools import wraps
@@ -147,7 +148,7 @@ class CDSRate(BaseInterestRate):
         """
         # Returns None if impossible to obtain a rate helper from this time series
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         self.link_to_term_structure(date=date, yield_curve=base_yield_curve)
         self.helper_rate.setValue(float(rate))
@@ -17,6 +17,7 @@
 """
 DepositRate class, to represent deposit rates.
 """
+import math
 import QuantLib as ql
 import numpy as np
 from tsfin.constants import CALENDAR, MATURITY_DATE, BUSINESS_CONVENTION, DAY_COUNTER, FIXING_DAYS, SPREAD_TAG
@@ -60,7 +61,7 @@ class DepositRateFuture(BaseInterestRate):
         if self.is_expired(date, **other_args):
             return None
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         time = self.day_counter.yearFraction(date, self.maturity(date))
         rate = ql.InterestRate(rate, self.day_counter, self.compounding, self.frequency)
@@ -17,6 +17,7 @@
 """
 EurodollarFuture class, to represent eurodollar futures.
 """
+import math
 import numpy as np
 import QuantLib as ql
 from tsfin.instruments.interest_rates.base_interest_rate import BaseInterestRate
@@ -163,7 +164,7 @@ class EurodollarFuture(BaseInterestRate):
         if self.is_expired(date, **other_args):
             return None
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         date = to_ql_date(date)
         self.helper_rate.setValue(float(rate))
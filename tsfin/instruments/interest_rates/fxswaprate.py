@@ -17,6 +17,7 @@
 """
 A class for modelling FX swaps.
 """
+import math
 import QuantLib as ql
 import numpy as np
 from tsfin.instruments.interest_rates.base_interest_rate import BaseInterestRate
@@ -93,11 +94,11 @@ class FxSwapRate(BaseInterestRate):
         if self.is_expired(date, **other_args):
             return None
         fx_spot = self.currency_ts.price.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(fx_spot):
+        if math.isnan(fx_spot):
             return None
         self.currency_spot_rate.setValue(fx_spot)
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)/10000
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         self.helper_rate.setValue(float(rate))
         return ql.FxSwapRateHelper(ql.QuoteHandle(self.helper_rate),
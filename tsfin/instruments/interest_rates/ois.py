@@ -17,10 +17,11 @@
 """
 A class for modelling OIS (Overnight Indexed Swap) rates.
 """
+import math
 import QuantLib as ql
 import numpy as np
 from tsfin.instruments.interest_rates.base_interest_rate import BaseInterestRate
-from tsfin.base import to_ql_rate_index, to_ql_date
+from tsfin.base import to_ql_rate_index, to_ql_date, to_ql_date_serials, to_datetime, EPOCH_SERIAL_NUMBER
 from tsfin.constants import SETTLEMENT_DAYS, INDEX, PAYMENT_LAG, INDEX_TENOR
 
 
@@ -48,6 +49,30 @@ class OISRate(BaseInterestRate):
         self.month_end = self.index.endOfMonth()
         # Rate Helper
         self.helper_rate = ql.SimpleQuote(0)
+        # Quotes looked up by prepare_for_dates, by QuantLib serial number, and the last_available they used.
+        self._prepared_rates = dict()
+        self._prepared_last_available = None
+
+    def prepare_for_dates(self, dates, last_available=True, **other_args):
+        """Look up the quotes of all the dates of a yield curve build at once, for :py:meth:`rate_helper`.
+
+        :param dates: list of QuantLib.Date
+            Reference dates.
+        :param last_available: bool, optional
+            Whether to use last available quotes if missing data.
+        :return:
+        """
+        serials = np.atleast_1d(to_ql_date_serials(dates))
+        index = to_datetime((serials - EPOCH_SERIAL_NUMBER).astype('datetime64[D]'))
+        rates = self.quotes.get_values(index=index, last_available=last_available, fill_value=np.nan)
+        self._prepared_rates = dict(zip(serials.tolist(), np.asarray(rates, dtype=np.float64).tolist()))
+        self._prepared_last_available = last_available
+
+    def clear_prepared_dates(self):
+        """Drop the quotes looked up by :py:meth:`prepare_for_dates`, once the yield curve build is done.
+        """
+        self._prepared_rates = dict()
+        self._prepared_last_available = None
 
     def rate_helper(self, date, last_available=True, spread=None, sigma=None, mean=None, **other_args):
         """Helper for yield curve construction.
@@ -69,8 +94,12 @@ class OISRate(BaseInterestRate):
         date = to_ql_date(date)
         if self.is_expired(date, **other_args):
             return None
-        rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        rate = None
+        if last_available == self._prepared_last_available:
+            rate = self._prepared_rates.get(date.serialNumber())
+        if rate is None:
+            rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
+        if math.isnan(rate):
             return None
         self.helper_rate.setValue(float(rate))
         return ql.OISRateHelper(self.settlement_days,
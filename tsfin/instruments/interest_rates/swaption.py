@@ -17,6 +17,7 @@
 """
 A class for modelling interest rate swaption.
 """
+import math
 import QuantLib as ql
 import numpy as np
 from tsfin.instruments.interest_rates.base_interest_rate import BaseInterestRate
@@ -85,7 +86,7 @@ class Swaption(BaseInterestRate):
         if self.is_expired(date, **other_args):
             return None
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         self.helper_rate.setValue(float(rate))
         return ql.SwaptionHelper(self.maturity_tenor,
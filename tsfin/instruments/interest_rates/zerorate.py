@@ -17,6 +17,7 @@
 """
 DepositRate class, to represent deposit rates.
 """
+import math
 import QuantLib as ql
 import numpy as np
 from tsfin.constants import CALENDAR, TENOR_PERIOD, BUSINESS_CONVENTION, DAY_COUNTER, FIXING_DAYS
@@ -56,7 +57,7 @@ class ZeroRate(BaseInterestRate):
         if self.is_expired(date, **other_args):
             return None
         rate = self.quotes.get_values(index=date, last_available=last_available, fill_value=np.nan)
-        if np.isnan(rate):
+        if math.isnan(rate):
             return None
         date = to_ql_date(date)
         time = self.day_counter.yearFraction(date, self.maturity(date))
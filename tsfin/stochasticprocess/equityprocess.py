@@ -19,6 +19,10 @@ A class for modelling volatility processes and its different implementations
 """
 import QuantLib as ql
 import numpy as np
+from collections import OrderedDict
+
+# Maximum number of processes stored by volatility quote, per equity process.
+PROCESS_CACHE_SIZE = 1024
 
 
 class BaseEquityProcess:
@@ -36,12 +40,45 @@ class BaseEquityProcess:
         self.compounding = ql.Continuous
         self.dividend_yield = ql.SimpleQuote(0)
         self.spot_price = ql.SimpleQuote(0)
+        # The volatility quote shared by the options priced with the process, set to each option volatility in turn.
+        self.volatility = ql.SimpleQuote(0)
         self.risk_free_handle = ql.RelinkableYieldTermStructureHandle()
         self.dividend_handle = ql.YieldTermStructureHandle(ql.FlatForward(0, self.calendar,
                                                                           ql.QuoteHandle(self.dividend_yield),
                                                                           self.day_counter, self.compounding))
         self.spot_price_handle = ql.QuoteHandle(self.spot_price)
-        self._process = dict()
+        self._process = OrderedDict()
+
+    def _stored_process(self, volatility):
+        """ The process already built for the volatility quote, or None.
+
+        :param volatility: QuantLib.SimpleQuote
+            The volatility quote.
+        :return: QuantLib.StochasticProcess, None
+        """
+        key = id(volatility)
+        try:
+            # The quote is stored along with the process, so its id can't be reused while the key is in the cache.
+            _, process = self._process[key]
+        except KeyError:
+            return None
+        self._process.move_to_end(key)
+        return process
+
+    def _store_process(self, volatility, process):
+        """ Store the process built for the volatility quote, dropping the least recently used beyond
+        PROCESS_CACHE_SIZE.
+
+        :param volatility: QuantLib.SimpleQuote
+            The volatility quote.
+        :param process: QuantLib.StochasticProcess
+            The process.
+        :return: QuantLib.StochasticProcess
+        """
+        self._process[id(volatility)] = (volatility, process)
+        while len(self._process) > PROCESS_CACHE_SIZE:
+            self._process.popitem(last=False)
+        return process
 
 
 class BlackScholesMerton(BaseEquityProcess):
@@ -59,12 +96,16 @@ class BlackScholesMerton(BaseEquityProcess):
 
     def process(self, volatility, **kwargs):
 
+        process = self._stored_process(volatility)
+        if process is not None:
+            return process
         black_constant_vol = ql.BlackConstantVol(0, self.calendar, ql.QuoteHandle(volatility), self.day_counter)
         volatility_handle = ql.BlackVolTermStructureHandle(black_constant_vol)
-        return ql.BlackScholesMertonProcess(self.spot_price_handle,
-                                            self.dividend_handle,
-                                            self.risk_free_handle,
-                                            volatility_handle)
+        process = ql.BlackScholesMertonProcess(self.spot_price_handle,
+                                               self.dividend_handle,
+                                               self.risk_free_handle,
+                                               volatility_handle)
+        return self._store_process(volatility, process)
 
 
 class BlackScholes(BaseEquityProcess):
@@ -82,11 +123,15 @@ class BlackScholes(BaseEquityProcess):
 
     def process(self, volatility, **kwargs):
 
+        process = self._stored_process(volatility)
+        if process is not None:
+            return process
         black_constant_vol = ql.BlackConstantVol(0, self.calendar, ql.QuoteHandle(volatility), self.day_counter)
         volatility_handle = ql.BlackVolTermStructureHandle(black_constant_vol)
-        return ql.BlackScholesProcess(self.spot_price_handle,
-                                      self.risk_free_handle,
-                                      volatility_handle)
+        process = ql.BlackScholesProcess(self.spot_price_handle,
+                                         self.risk_free_handle,
+                                         volatility_handle)
+        return self._store_process(volatility, process)
 
 
 class Heston(BaseEquityProcess):